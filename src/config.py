@@ -2,43 +2,163 @@
 Configuration loading and validation for MySQL Database Dumper.
 """
 
+import logging
+import marshal
 import os
 import re
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
+# LibYAML-backed loader is several times faster; fall back to pure Python
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Whether the missing-libyaml warning still has to be shown
+_warn_pure_python_loader = SafeLoader is yaml.SafeLoader
+
 
 class ConfigLoader:
     """Loads and validates configuration from YAML file."""
 
     ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+    CACHE_SUFFIX = '.cache'
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, use_cache: bool = False):
         self.config_path = config_path
+        self.use_cache = use_cache
         self.config = self._load_config()
 
     def _load_config(self) -> dict[str, Any]:
         """Load configuration from YAML file."""
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = self._load_cached() if self.use_cache else None
+        if config is None:
+            self._warn_if_pure_python_loader()
+            with open(self.config_path, 'r') as f:
+                config = yaml.load(f, Loader=SafeLoader)
+            if self.use_cache:
+                self._write_cache(config)
+
+        config = self._resolve_env_vars(config)
+        self._freeze_exclusions(config)
+        return config
+
+    @staticmethod
+    def _warn_if_pure_python_loader() -> None:
+        """Warn once per process when PyYAML was built without libyaml."""
+        global _warn_pure_python_loader
+        if _warn_pure_python_loader:
+            _warn_pure_python_loader = False
+            logging.warning(
+                "PyYAML C loader not available; install libyaml for faster config parsing"
+            )
+
+    @property
+    def cache_path(self) -> str:
+        """Path of the parsed-config cache file."""
+        return self.config_path + self.CACHE_SUFFIX
+
+    def _source_signature(self) -> tuple[int, int]:
+        """Modification time and size of the config file."""
+        st = os.stat(self.config_path)
+        return st.st_mtime_ns, st.st_size
+
+    def _load_cached(self) -> Any:
+        """Load the parsed config from cache, or None if missing or stale.
+
+        The cache holds the YAML as parsed, before env var resolution, so
+        values taken from the environment never reach disk and env changes
+        need no invalidation. marshal is used instead of pickle because
+        loading it cannot execute code.
+        """
+        try:
+            with open(self.cache_path, 'rb') as f:
+                signature, config = marshal.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logging.debug("Ignoring unreadable config cache '%s': %s", self.cache_path, e)
+            return None
+
+        if tuple(signature) != self._source_signature():
+            return None
+        return config
 
-        return self._resolve_env_vars(config)
+    def _write_cache(self, config: Any) -> None:
+        """Write the parsed config to cache, ignoring failures."""
+        try:
+            data = marshal.dumps((self._source_signature(), config))
+        except ValueError:
+            # YAML produced types marshal cannot store (e.g. dates)
+            return
+        try:
+            fd = os.open(self.cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        except OSError as e:
+            logging.debug("Could not write config cache '%s': %s", self.cache_path, e)
+
+    def _freeze_exclusions(self, config: Any) -> None:
+        """Store each database's exclude_tables as a tuple.
+
+        Tuples are hashable, so the dumper can cache one compiled matcher per
+        unique pattern list for the whole run.
+        """
+        if not isinstance(config, dict):
+            return
+        for db_config in config.get('databases') or []:
+            if isinstance(db_config, dict) and db_config.get('exclude_tables'):
+                db_config['exclude_tables'] = tuple(db_config['exclude_tables'])
 
     def _resolve_env_vars(self, obj: Any) -> Any:
-        """Recursively resolve environment variables in config."""
+        """Resolve environment variables in config.
+
+        Nested dicts and lists are walked with an explicit stack and updated
+        in place; the (same) root object is returned.
+        """
+        # Environment is fixed for the duration of one load; look each
+        # variable up once however many strings reference it
+        env_values: dict[str, str] = {}
+
+        def lookup(match: re.Match) -> str:
+            name = match.group(1)
+            value = env_values.get(name)
+            if value is None:
+                value = env_values[name] = os.environ.get(name, '')
+            return value
+
         if isinstance(obj, str):
-            matches = self.ENV_VAR_PATTERN.findall(obj)
-            for match in matches:
-                env_value = os.environ.get(match, '')
-                obj = obj.replace(f'${{{match}}}', env_value)
+            return self._resolve_env_string(obj, lookup)
+        if not isinstance(obj, (dict, list)):
             return obj
-        elif isinstance(obj, dict):
-            return {k: self._resolve_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._resolve_env_vars(item) for item in obj]
+
+        stack = [obj]
+        seen = set()
+        while stack:
+            container = stack.pop()
+            # YAML anchors can share one container between several nodes
+            if id(container) in seen:
+                continue
+            seen.add(id(container))
+
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, str):
+                    if '${' in value:
+                        container[key] = self._resolve_env_string(value, lookup)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
         return obj
 
+    def _resolve_env_string(self, value: str, lookup: Callable[[re.Match], str]) -> str:
+        """Replace ${VAR} placeholders in a string using `lookup` for values."""
+        # Most scalars carry no placeholder; skip the regex engine for them
+        if '${' not in value:
+            return value
+        return self.ENV_VAR_PATTERN.sub(lookup, value)
+
     def get_instance(self, instance_name: str) -> dict[str, Any]:
         """Get database instance configuration."""
         instances = self.config.get('instances', {})
@@ -3,19 +3,50 @@
 """
 
 import logging
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional, Any
 
 import mysql.connector
 from mysql.connector import Error as MySQLError
+from mysql.connector.pooling import CNX_POOL_MAXSIZE, MySQLConnectionPool
 
 from .models import ColumnInfo
 
 
+def _column_info(row: tuple) -> ColumnInfo:
+    """Build ColumnInfo from a (name, type, null, key, default, extra) row.
+
+    Some mysql-connector versions return metadata text as bytes; it is
+    decoded so callers can always treat it as str.
+    """
+    name, col_type, nullable, key, default, extra = (
+        value.decode('utf-8') if isinstance(value, (bytes, bytearray)) else value
+        for value in row
+    )
+    return ColumnInfo(
+        name=name,
+        type=col_type,
+        nullable=nullable,
+        key=key,
+        default=default,
+        extra=extra
+    )
+
+
 class DatabaseConnection:
     """Manages MySQL database connections with context manager support."""
 
     DEFAULT_PORT = 3306
     DEFAULT_CHARSET = 'utf8mb4'
+    # Seconds the server waits on a blocked write before aborting; streaming
+    # a large table stalls the server while the client compresses output
+    DEFAULT_NET_WRITE_TIMEOUT = 3600
+    # Seconds to wait for the session that aborts an abandoned stream
+    KILL_CONNECT_TIMEOUT = 5
+    # Pooled sessions already configured, by server and connection id; a
+    # reconnect gets a new id and is configured again
+    _configured_sessions: set[tuple[str, int, int]] = set()
 
     def __init__(
         self,
@@ -23,14 +54,112 @@ def __init__(
         port: int,
         user: str,
         password: str,
-        database: Optional[str] = None
+        database: Optional[str] = None,
+        compress: bool = False,
+        net_write_timeout: Optional[int] = DEFAULT_NET_WRITE_TIMEOUT
     ):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
         self.database = database
+        self.compress = compress
+        self.net_write_timeout = net_write_timeout
         self.connection = None
+        self._meta_cursor = None
+        # Table metadata is stable for a session; cleared on disconnect
+        self._columns_cache: dict[str, list[ColumnInfo]] = {}
+        self._create_table_cache: dict[str, str] = {}
+        self._max_allowed_packet: Optional[int] = None
+
+    @classmethod
+    def create_pool(
+        cls,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        pool_size: int,
+        compress: bool = False
+    ) -> MySQLConnectionPool:
+        """Create a connection pool for an instance.
+
+        Pool size is capped at mysql.connector's maximum pool size. Sessions
+        are not reset when connections are returned, so session settings
+        applied on first checkout persist (see from_pooled).
+        """
+        return MySQLConnectionPool(
+            pool_size=min(max(1, pool_size), CNX_POOL_MAXSIZE),
+            pool_reset_session=False,
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            charset=cls.DEFAULT_CHARSET,
+            use_unicode=True,
+            compress=compress
+        )
+
+    def _apply_session_settings(self) -> None:
+        """Apply session settings to the open connection.
+
+        Run as a statement rather than the driver's init_command option,
+        which older mysql-connector-python releases do not accept.
+        """
+        if self.net_write_timeout:
+            self.connection.cmd_query(
+                f"SET SESSION net_write_timeout = {int(self.net_write_timeout)}"
+            )
+
+    @staticmethod
+    def close_pool(pool: MySQLConnectionPool) -> None:
+        """Close a pool's connections by checking each out and disconnecting it.
+
+        mysql.connector has no public way to close a pool. Call once every
+        connection has been returned; disconnected connections are not
+        returned, so the pool ends up empty.
+        """
+        while True:
+            try:
+                pooled = pool.get_connection()
+            except MySQLError:
+                # PoolError once empty; a failed reconnect also ends the loop
+                return
+            # disconnect() closes the socket; close() would return it to the pool
+            pooled.disconnect()
+
+    @classmethod
+    def from_pooled(
+        cls,
+        connection: Any,
+        database: Optional[str] = None,
+        password: str = '',
+        compress: bool = False,
+        net_write_timeout: Optional[int] = DEFAULT_NET_WRITE_TIMEOUT
+    ) -> "DatabaseConnection":
+        """Wrap an already-open pooled connection.
+
+        The wrapper skips the connection handshake; disconnecting returns
+        the connection to its pool instead of closing the socket. `password`
+        and `compress` are only kept for tools that open their own
+        connection (mysqldump).
+        Session settings are applied once per physical connection.
+        """
+        conn = cls(
+            host=connection.server_host,
+            port=connection.server_port,
+            user=connection.user,
+            password=password,
+            database=database,
+            compress=compress,
+            net_write_timeout=net_write_timeout
+        )
+        conn.connection = connection
+        session = (conn.host, conn.port, connection.connection_id)
+        if session not in cls._configured_sessions:
+            conn._apply_session_settings()
+            cls._configured_sessions.add(session)
+        return conn
 
     def __enter__(self) -> "DatabaseConnection":
         """Context manager entry - establish connection."""
@@ -43,44 +172,120 @@ def __exit__(self, exc_type, exc_val, exc_tb) -> None:
 
     def connect(self) -> None:
         """Establish database connection."""
+        if self.connection is not None:
+            return
+
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                charset=self.DEFAULT_CHARSET,
-                use_unicode=True
-            )
-            logging.info(f"Connected to {self.host}:{self.port}/{self.database or 'N/A'}")
+            self.connection = mysql.connector.connect(**self._connect_kwargs())
+            self._apply_session_settings()
+            logging.info("Connected to %s:%s/%s", self.host, self.port, self.database or 'N/A')
         except MySQLError as e:
-            logging.error(f"Failed to connect to database: {e}")
+            logging.error("Failed to connect to database: %s", e)
             raise
 
+    def _connect_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for mysql.connector.connect."""
+        return {
+            'host': self.host,
+            'port': self.port,
+            'user': self.user,
+            'password': self.password,
+            'database': self.database,
+            'charset': self.DEFAULT_CHARSET,
+            'use_unicode': True,
+            'compress': self.compress,
+        }
+
     def disconnect(self) -> None:
         """Close database connection."""
+        if self._meta_cursor is not None:
+            self._meta_cursor.close()
+            self._meta_cursor = None
+        self._columns_cache.clear()
+        self._create_table_cache.clear()
+        self._max_allowed_packet = None
         if self.connection and self.connection.is_connected():
             self.connection.close()
             logging.debug("Database connection closed")
+        self.connection = None
+
+    def use_database(self, database: str) -> None:
+        """Switch the open connection to another database.
+
+        Cached table metadata belongs to the previous database and is cleared.
+        """
+        if database == self.database:
+            return
+        self.connection.cmd_init_db(database)
+        self.database = database
+        self._columns_cache.clear()
+        self._create_table_cache.clear()
 
     def execute_query(self, query: str, params: Optional[tuple] = None) -> list[tuple]:
-        """Execute a query and return results."""
-        cursor = self.connection.cursor()
-        try:
-            cursor.execute(query, params)
-            return cursor.fetchall()
-        finally:
-            cursor.close()
+        """Execute a query and return results.
 
-    def get_cursor(self, buffered: bool = False):
+        Reuses one buffered cursor per connection for metadata queries; it is
+        closed on disconnect. Use get_cursor for large result sets.
+        """
+        if self._meta_cursor is None:
+            self._meta_cursor = self.connection.cursor(buffered=True)
+        self._meta_cursor.execute(query, params)
+        return self._meta_cursor.fetchall()
+
+    def get_cursor(self, buffered: bool = False, fetch_size: Optional[int] = None):
         """Get a cursor for streaming large results.
 
         Args:
-            buffered: If False (default), uses server-side cursor for memory-efficient
+            buffered: If False (default), uses an unbuffered cursor that reads
+                     rows from the socket as they are fetched, for memory-efficient
                      streaming of large result sets. If True, uses buffered cursor.
+            fetch_size: Default number of rows returned by fetchmany().
+
+        Close unbuffered cursors with close_cursor().
         """
-        return self.connection.cursor(buffered=buffered)
+        cursor = self.connection.cursor(buffered=buffered)
+        if fetch_size:
+            cursor.arraysize = fetch_size
+        return cursor
+
+    def close_cursor(self, cursor) -> None:
+        """Close a streaming cursor, discarding any rows it has not fetched.
+
+        An unbuffered cursor abandoned mid-result (e.g. when writing the dump
+        fails) would otherwise raise "Unread result found" on close, hiding
+        the original error and leaving the connection out of sync. The
+        statement is killed first, so only rows already in flight are read
+        instead of the rest of the table.
+        """
+        if self.connection is not None and self.connection.unread_result:
+            self._kill_query()
+            try:
+                self.connection.consume_results()
+            except MySQLError:
+                # A killed statement ends with "Query execution was interrupted"
+                pass
+        cursor.close()
+
+    def _kill_query(self) -> None:
+        """Abort the statement running on this connection from a second session.
+
+        The session only sends KILL QUERY, so net_write_timeout is not set on
+        it; a short connect timeout keeps an unreachable server from delaying
+        the original error.
+        """
+        try:
+            killer = mysql.connector.connect(
+                **self._connect_kwargs(), connection_timeout=self.KILL_CONNECT_TIMEOUT
+            )
+        except MySQLError as e:
+            logging.warning("Could not abort streaming query, draining it instead: %s", e)
+            return
+        try:
+            killer.cmd_query(f"KILL QUERY {int(self.connection.connection_id)}")
+        except MySQLError as e:
+            logging.warning("Could not abort streaming query, draining it instead: %s", e)
+        finally:
+            killer.close()
 
     def get_tables(self) -> list[str]:
         """Get list of all tables in the current database."""
@@ -88,24 +293,45 @@ def get_tables(self) -> list[str]:
         return [row[0] for row in results]
 
     def get_table_columns(self, table: str) -> list[ColumnInfo]:
-        """Get column information for a table."""
+        """Get column information for a table (cached per connection)."""
+        columns = self._columns_cache.get(table)
+        if columns is not None:
+            return columns
+
         results = self.execute_query(f"DESCRIBE `{table}`")
-        return [
-            ColumnInfo(
-                name=row[0],
-                type=row[1],
-                nullable=row[2],
-                key=row[3],
-                default=row[4],
-                extra=row[5]
-            )
-            for row in results
-        ]
+        columns = self._columns_cache[table] = [_column_info(row) for row in results]
+        return columns
+
+    def get_all_columns(self, database: str) -> dict[str, list[ColumnInfo]]:
+        """Get column information for every table in a database in one query.
+
+        Returns a mapping of table name to columns in ordinal order, matching
+        what get_table_columns returns for each table.
+        """
+        results = self.execute_query(
+            "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, "
+            "COLUMN_DEFAULT, EXTRA FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = %s ORDER BY TABLE_NAME, ORDINAL_POSITION",
+            (database,)
+        )
+        return {
+            table: [_column_info(row[1:]) for row in rows]
+            for table, rows in groupby(results, key=itemgetter(0))
+        }
 
     def get_create_table(self, table: str) -> str:
-        """Get CREATE TABLE statement."""
-        results = self.execute_query(f"SHOW CREATE TABLE `{table}`")
-        return results[0][1]
+        """Get CREATE TABLE statement (cached per connection)."""
+        statement = self._create_table_cache.get(table)
+        if statement is None:
+            results = self.execute_query(f"SHOW CREATE TABLE `{table}`")
+            statement = self._create_table_cache[table] = results[0][1]
+        return statement
+
+    def get_max_allowed_packet(self) -> int:
+        """Get the server's max_allowed_packet in bytes (cached per connection)."""
+        if self._max_allowed_packet is None:
+            self._max_allowed_packet = int(self.execute_query("SELECT @@max_allowed_packet")[0][0])
+        return self._max_allowed_packet
 
     def get_row_count(self, table: str, where_clause: Optional[str] = None) -> int:
         """Get row count for a table."""
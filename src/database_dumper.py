@@ -4,39 +4,138 @@
 
 import fnmatch
 import logging
+import multiprocessing
+import os
 import re
+import shutil
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+from mysql.connector.errors import PoolError
 
 from .config import ConfigLoader
 from .connection import DatabaseConnection
-from .models import DatabaseStats, DumpSettings, DumpStats, OutputFormat, TableStats
+from .models import ColumnInfo, DatabaseStats, DumpSettings, DumpStats, OutputFormat, TableStats
 from .table_dumper import TableDumper
+from .utils import setup_logging
+
+# Per-process state for table dumps run in a ProcessPoolExecutor
+_worker_state: dict[str, Any] = {}
+
+
+def _init_table_worker(
+    output_settings: dict[str, Any],
+    dump_timestamp: str,
+    log_settings: dict[str, Any]
+) -> None:
+    """Set up a table dump worker process.
+
+    Spawned processes start with unconfigured logging, so the parent's
+    level and log file are applied again.
+    """
+    setup_logging(log_settings)
+    _worker_state['dumper'] = TableDumper(output_settings, dump_timestamp)
+
+
+def _dump_table_in_worker(
+    instance_config: dict[str, Any],
+    db_name: str,
+    table: str,
+    output_path: str,
+    settings: DumpSettings,
+    output_format: OutputFormat,
+    columns: Optional[list[ColumnInfo]]
+) -> TableStats:
+    """Dump one table in a worker process.
+
+    Connections cannot be shared across processes, so each table is dumped
+    over a connection opened in the worker itself.
+    """
+    try:
+        with DatabaseConnection(
+            host=instance_config['host'],
+            port=instance_config.get('port', DatabaseConnection.DEFAULT_PORT),
+            user=instance_config['user'],
+            password=instance_config['password'],
+            database=db_name,
+            **DatabaseDumper._session_options(instance_config)
+        ) as conn:
+            return _worker_state['dumper'].dump_table(
+                conn,
+                table=table,
+                output_path=output_path,
+                settings=settings,
+                output_format=output_format,
+                append=False,
+                columns=columns
+            )
+    except Exception as e:
+        return TableStats(table=table, error=str(e))
 
 
 class DatabaseDumper:
     """Main class for database dumping operations."""
 
+    DEFAULT_CONCURRENCY = 1
+    EXECUTORS = ('thread', 'process')
+    SUCCESS_LOG_BATCH = 100  # Successful tables reported per summary log line
+    MERGE_CHUNK_SIZE = 1024 * 1024  # Bytes per copy when merging part files
+
     def __init__(self, config: ConfigLoader):
         self.config = config
         self.output_settings = config.get_output_settings()
         self.defaults = config.get_defaults()
         self.stats = DumpStats()
-
-    def _compile_exclusion_patterns(self, exclude_patterns: list[str]) -> list[re.Pattern]:
+        # Output settings are constant for the run, so one dumper serves all tables
+        self._dumper = TableDumper(self.output_settings)
+        self.concurrency = max(
+            1, int(self.output_settings.get('dump_concurrency', self.DEFAULT_CONCURRENCY))
+        )
+        self.executor = self.output_settings.get('dump_executor', 'thread')
+        if self.executor not in self.EXECUTORS:
+            raise ValueError(
+                f"Unsupported dump_executor '{self.executor}'; "
+                f"expected one of {', '.join(self.EXECUTORS)}"
+            )
+        self._stats_lock = threading.Lock()
+
+        # Connection pools keyed by instance name, created on first use
+        self._pools: dict[str, Any] = {}
+        self._pools_lock = threading.Lock()
+        # Databases per instance in the current run; bounds pool sizes
+        self._instance_databases: Counter = Counter()
+        # Worker processes for dump_executor: process, shared by all databases of a run
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        # Table worker threads, shared by all databases of a run; each thread
+        # keeps one connection per instance across the tables it dumps
+        self._table_executor: Optional[ThreadPoolExecutor] = None
+        self._worker_local = threading.local()
+        self._worker_connections: list[DatabaseConnection] = []
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _compile_exclusions(patterns: tuple[str, ...]) -> re.Pattern:
         """
-        Pre-compile exclusion patterns to regex for faster matching.
+        Fuse exclusion patterns into a single compiled alternation regex.
 
-        Converts fnmatch patterns to compiled regex patterns.
+        Each fnmatch pattern becomes a named branch (p0, p1, ...) so a single
+        match per table decides exclusion and still reports which pattern hit.
+        Cached per unique pattern tuple.
         """
-        return [re.compile(fnmatch.translate(pattern)) for pattern in exclude_patterns]
+        return re.compile('|'.join(
+            f'(?P<p{i}>{fnmatch.translate(pattern)})' for i, pattern in enumerate(patterns)
+        ))
 
     def _is_table_excluded(
         self,
         table_name: str,
         exclude_patterns: list[str],
-        compiled_patterns: Optional[list[re.Pattern]] = None
+        compiled: Optional[re.Pattern] = None
     ) -> bool:
         """
         Check if a table should be excluded based on patterns.
@@ -45,20 +144,20 @@ def _is_table_excluded(
         - Exact matches: 'users_backup'
         - Wildcard patterns: '*_old', 'tmp_*', '*_backup_*'
 
-        Uses pre-compiled regex patterns for better performance when
-        checking many tables against the same exclusion list.
+        Pass the result of _compile_exclusions() as `compiled` to skip the
+        cache lookup when checking many tables against the same list.
         """
-        if compiled_patterns:
-            for i, compiled in enumerate(compiled_patterns):
-                if compiled.match(table_name):
-                    logging.debug(f"Table '{table_name}' excluded by pattern '{exclude_patterns[i]}'")
-                    return True
-        else:
-            for pattern in exclude_patterns:
-                if fnmatch.fnmatch(table_name, pattern):
-                    logging.debug(f"Table '{table_name}' excluded by pattern '{pattern}'")
-                    return True
-        return False
+        if not exclude_patterns:
+            return False
+        if compiled is None:
+            compiled = self._compile_exclusions(tuple(exclude_patterns))
+
+        match = compiled.match(table_name)
+        # Only resolve which pattern matched when it will actually be logged
+        if match is not None and logging.getLogger().isEnabledFor(logging.DEBUG):
+            pattern = exclude_patterns[int(match.lastgroup[1:])]
+            logging.debug("Table '%s' excluded by pattern '%s'", table_name, pattern)
+        return match is not None
 
     def run(
         self,
@@ -74,13 +173,38 @@ def run(
         output_dir = Path(self.output_settings.get('directory', './dumps'))
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        started_at = datetime.now()
+        timestamp = started_at.strftime('%Y%m%d_%H%M%S')
+        # Every file of this run carries the same generation time
+        self._dumper.dump_timestamp = started_at.isoformat()
         databases = self._filter_databases(database_filter, instance_filter)
+        self._instance_databases = Counter(
+            db_config.get('instance', 'primary') for db_config in databases
+        )
 
-        logging.info(f"Starting dump of {len(databases)} database(s)")
+        logging.info("Starting dump of %d database(s)", len(databases))
 
-        for db_config in databases:
-            self._dump_database(db_config, output_dir, timestamp)
+        try:
+            if self.concurrency > 1 and len(databases) > 1:
+                with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                    list(executor.map(
+                        lambda db_config: self._dump_database(db_config, output_dir, timestamp),
+                        databases
+                    ))
+            else:
+                for db_config in databases:
+                    self._dump_database(db_config, output_dir, timestamp)
+        finally:
+            if self._table_executor is not None:
+                self._table_executor.shutdown()
+                self._table_executor = None
+            for worker_conn in self._worker_connections:
+                worker_conn.disconnect()
+            self._worker_connections.clear()
+            self._close_pools()
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
 
         return self.stats
 
@@ -95,12 +219,12 @@ def _filter_databases(
         if database_filter:
             databases = [db for db in databases if db['name'] == database_filter]
             if not databases:
-                logging.warning(f"No database named '{database_filter}' found in configuration")
+                logging.warning("No database named '%s' found in configuration", database_filter)
 
         if instance_filter:
             databases = [db for db in databases if db.get('instance', 'primary') == instance_filter]
             if not databases:
-                logging.warning(f"No databases found for instance '{instance_filter}'")
+                logging.warning("No databases found for instance '%s'", instance_filter)
 
         return databases
 
@@ -117,26 +241,172 @@ def _dump_database(
         db_stats = DatabaseStats(name=db_name, instance=instance_name)
 
         try:
-            instance_config = self.config.get_instance(instance_name)
-
-            with DatabaseConnection(
-                host=instance_config['host'],
-                port=instance_config.get('port', DatabaseConnection.DEFAULT_PORT),
-                user=instance_config['user'],
-                password=instance_config['password'],
-                database=db_name
-            ) as conn:
+            with self._connect(db_config) as conn:
                 self._process_database_tables(conn, db_config, db_stats, output_dir, timestamp)
 
         except Exception as e:
-            logging.error(f"Error dumping database '{db_name}': {e}")
-            self.stats.errors.append({
-                'database': db_name,
-                'table': None,
-                'error': str(e)
-            })
+            logging.error("Error dumping database '%s': %s", db_name, e)
+            with self._stats_lock:
+                self.stats.errors.append({
+                    'database': db_name,
+                    'table': None,
+                    'error': str(e)
+                })
+
+        with self._stats_lock:
+            self.stats.databases.append(db_stats)
+
+    def _connect(self, db_config: dict[str, Any]) -> DatabaseConnection:
+        """Get a connection to a database from its instance's pool.
+
+        mysql.connector connections are not thread-safe, so every worker
+        thread must use its own connection. Falls back to a dedicated
+        connection when the pool is exhausted.
+        """
+        db_name = db_config['name']
+        instance_name = db_config.get('instance', 'primary')
+        pool = self._get_pool(instance_name)
 
-        self.stats.databases.append(db_stats)
+        try:
+            pooled = pool.get_connection()
+        except PoolError:
+            logging.debug(
+                "Connection pool for '%s' exhausted, opening a new connection", instance_name
+            )
+            return self._new_connection(instance_name, db_name)
+
+        instance_config = self.config.get_instance(instance_name)
+        try:
+            pooled.cmd_init_db(db_name)
+            return DatabaseConnection.from_pooled(
+                pooled,
+                database=db_name,
+                password=instance_config['password'],
+                **self._session_options(instance_config)
+            )
+        except Exception:
+            pooled.close()
+            raise
+
+    def _new_connection(self, instance_name: str, db_name: str) -> DatabaseConnection:
+        """Create a dedicated, not yet opened connection to a database."""
+        instance_config = self.config.get_instance(instance_name)
+        return DatabaseConnection(
+            host=instance_config['host'],
+            port=instance_config.get('port', DatabaseConnection.DEFAULT_PORT),
+            user=instance_config['user'],
+            password=instance_config['password'],
+            database=db_name,
+            **self._session_options(instance_config)
+        )
+
+    def _worker_connection(self, db_config: dict[str, Any]) -> DatabaseConnection:
+        """Get the calling table worker thread's connection to a database.
+
+        Each worker thread opens one connection per instance on first use and
+        keeps it for the rest of the run, switching databases as needed.
+        All are closed when the run ends.
+        """
+        db_name = db_config['name']
+        instance_name = db_config.get('instance', 'primary')
+        connections = getattr(self._worker_local, 'connections', None)
+        if connections is None:
+            connections = self._worker_local.connections = {}
+
+        conn = connections.get(instance_name)
+        if conn is None:
+            conn = connections[instance_name] = self._new_connection(instance_name, db_name)
+            with self._pools_lock:
+                self._worker_connections.append(conn)
+        # A no-op when open; reopens after a dump dropped the connection
+        conn.connect()
+        conn.use_database(db_name)
+        return conn
+
+    def _get_table_executor(self) -> ThreadPoolExecutor:
+        """Get the run's table worker threads, starting them on first use."""
+        with self._pools_lock:
+            if self._table_executor is None:
+                self._table_executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            return self._table_executor
+
+    def _get_pool(self, instance_name: str) -> Any:
+        """Get the connection pool for an instance, creating it on first use.
+
+        MySQLConnectionPool opens all of its connections when created, so the
+        pool holds one connection per database that can be dumped at once:
+        `dump_concurrency`, capped at the instance's database count for the
+        run. Table workers use their own persistent connections instead (see
+        _worker_connection), and a database's pooled connection is returned
+        once its tables are handed to them.
+        """
+        with self._pools_lock:
+            pool = self._pools.get(instance_name)
+            if pool is None:
+                instance_config = self.config.get_instance(instance_name)
+                pool = DatabaseConnection.create_pool(
+                    host=instance_config['host'],
+                    port=instance_config.get('port', DatabaseConnection.DEFAULT_PORT),
+                    user=instance_config['user'],
+                    password=instance_config['password'],
+                    pool_size=min(
+                        self.concurrency,
+                        self._instance_databases[instance_name] or self.concurrency
+                    ),
+                    compress=self._session_options(instance_config)['compress']
+                )
+                self._pools[instance_name] = pool
+            return pool
+
+    @staticmethod
+    def _session_options(instance_config: dict[str, Any]) -> dict[str, Any]:
+        """Per-instance protocol compression and session timeout settings."""
+        return {
+            'compress': bool(instance_config.get('compress', False)),
+            'net_write_timeout': instance_config.get(
+                'net_write_timeout', DatabaseConnection.DEFAULT_NET_WRITE_TIMEOUT
+            ),
+        }
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the run's table worker processes, starting them on first use.
+
+        Workers are spawned rather than forked: the parent may be running
+        database threads holding locks and open sockets at that moment.
+        """
+        with self._pools_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.concurrency,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_table_worker,
+                    initargs=(
+                        self.output_settings,
+                        self._dumper.dump_timestamp,
+                        self._current_log_settings()
+                    )
+                )
+            return self._process_pool
+
+    @staticmethod
+    def _current_log_settings() -> dict[str, Any]:
+        """Logging settings in effect in this process, as setup_logging takes them.
+
+        Read from the root logger so command-line overrides (--verbose) carry over.
+        """
+        root = logging.getLogger()
+        log_settings: dict[str, Any] = {'level': logging.getLevelName(root.getEffectiveLevel())}
+        for handler in root.handlers:
+            if isinstance(handler, logging.FileHandler):
+                log_settings['file'] = handler.baseFilename
+        return log_settings
+
+    def _close_pools(self) -> None:
+        """Close all connection pools."""
+        with self._pools_lock:
+            for pool in self._pools.values():
+                DatabaseConnection.close_pool(pool)
+            self._pools.clear()
 
     def _process_database_tables(
         self,
@@ -147,42 +417,172 @@ def _process_database_tables(
         timestamp: str
     ) -> None:
         """Process and dump all tables for a database."""
+        # Settings are constant across tables; look them up once
         db_name = db_config['name']
         separate_files = self.output_settings.get('separate_files', True)
+        timestamp_suffix = self.output_settings.get('timestamp_suffix', True)
+        output_format = OutputFormat(self.output_settings.get('format', 'sql'))
+        ext = output_format.extension
+        stem = f"{db_name}_{timestamp}" if timestamp_suffix else db_name
 
         # Create output subdirectory only for separate_files mode
         if separate_files:
-            if self.output_settings.get('timestamp_suffix', True):
-                db_output_dir = output_dir / f"{db_name}_{timestamp}"
-            else:
-                db_output_dir = output_dir / db_name
-            db_output_dir.mkdir(parents=True, exist_ok=True)
+            db_output_dir = output_dir / stem
+            single_file_path = None
         else:
-            # Single file mode: use output_dir directly
+            # Single file mode: every table goes to one file in output_dir
             db_output_dir = output_dir
-            db_output_dir.mkdir(parents=True, exist_ok=True)
+            single_file_path = output_dir / f"{stem}.{ext}"
+        db_output_dir.mkdir(parents=True, exist_ok=True)
+        # Per-table paths are plain string concatenation onto a cached prefix
+        path_prefix = os.path.join(str(db_output_dir), '')
 
         # Get tables to dump
         tables_to_dump = self._get_tables_to_dump(conn, db_config)
-        logging.info(f"Dumping {len(tables_to_dump)} table(s) from '{db_name}'")
+        logging.info("Dumping %d table(s) from '%s'", len(tables_to_dump), db_name)
+
+        # One metadata round-trip for the whole database instead of one per table
+        all_columns = conn.get_all_columns(db_name) if tables_to_dump else {}
+
+        # Successful tables are logged in batches; failures are logged at once
+        succeeded: list[str] = []
+
+        if self.concurrency > 1 and len(tables_to_dump) > 1:
+            # Workers dump over their own connections; return the pooled one
+            # now instead of holding it idle until every table is done
+            conn.disconnect()
+            # Every worker writes its own file; in single-file mode these are
+            # part files concatenated in table order afterwards
+            jobs = []
+            for i, table_config in enumerate(tables_to_dump):
+                table, output_path, settings, _ = self._table_dump_args(
+                    table_config, db_config, path_prefix, output_format, None, False
+                )
+                if single_file_path is not None:
+                    output_path = f"{single_file_path}.{i}.part"
+                jobs.append((table, output_path, settings))
+
+            results = self._dump_tables_parallel(db_config, jobs, output_format, all_columns)
+            if single_file_path is None:
+                for table_stats in results:
+                    self._record_table_result(table_stats, db_stats, db_name, succeeded)
+            else:
+                parts = []
+                # Compression appends its extension to every part and the merged file
+                merged_path = str(single_file_path)
+                if self._dumper.compression:
+                    extension = TableDumper.COMPRESSION_EXTENSIONS[self._dumper.compression]
+                    merged_path = f"{merged_path}.{extension}"
+                for table_stats in results:
+                    if table_stats.success:
+                        parts.append(table_stats.file_path)
+                    elif table_stats.file_path and os.path.exists(table_stats.file_path):
+                        os.unlink(table_stats.file_path)
+                    table_stats.file_path = merged_path
+                    self._record_table_result(table_stats, db_stats, db_name, succeeded)
+                if parts:
+                    self._concatenate_files(merged_path, parts)
+        else:
+            for i, table_config in enumerate(tables_to_dump):
+                table_stats = self._dump_single_table(
+                    conn, table_config, db_config, path_prefix,
+                    output_format, single_file_path, is_first=(i == 0),
+                    columns=all_columns.get(table_config['name'])
+                )
+                self._record_table_result(table_stats, db_stats, db_name, succeeded)
 
-        # Create dumper and process tables
-        dumper = TableDumper(conn, self.output_settings)
-        output_format = OutputFormat(self.output_settings.get('format', 'sql'))
-        separate_files = self.output_settings.get('separate_files', True)
+        self._flush_success_log(succeeded, db_name)
 
-        for i, table_config in enumerate(tables_to_dump):
-            table_stats = self._dump_single_table(
-                dumper, table_config, db_config, db_output_dir,
-                output_format, separate_files, timestamp, is_first=(i == 0)
+    def _dump_tables_parallel(
+        self,
+        db_config: dict[str, Any],
+        jobs: list[tuple[str, str, DumpSettings]],
+        output_format: OutputFormat,
+        all_columns: dict[str, list[ColumnInfo]]
+    ) -> Iterator[TableStats]:
+        """Dump tables concurrently, yielding their stats in job order.
+
+        `jobs` holds (table, output_path, settings) tuples. Each worker dumps
+        over its own connection; errors are returned as TableStats.
+        """
+        db_name = db_config['name']
+
+        if self.executor == 'process':
+            # Worker processes format and compress on their own cores
+            instance_config = self.config.get_instance(db_config.get('instance', 'primary'))
+            executor = self._get_process_pool()
+            futures = [
+                executor.submit(
+                    _dump_table_in_worker, instance_config, db_name, table, output_path,
+                    settings, output_format, all_columns.get(table)
+                )
+                for table, output_path, settings in jobs
+            ]
+            for future in futures:
+                yield future.result()
+            return
+
+        def dump_in_worker(job: tuple[str, str, DumpSettings]) -> TableStats:
+            table, output_path, settings = job
+            try:
+                worker_conn = self._worker_connection(db_config)
+            except Exception as e:
+                return TableStats(table=table, error=str(e))
+            table_stats = self._dumper.dump_table(
+                worker_conn,
+                table=table,
+                output_path=output_path,
+                settings=settings,
+                output_format=output_format,
+                append=False,
+                columns=all_columns.get(table)
             )
+            if not table_stats.success:
+                # The session may be broken; the thread's next table reconnects
+                worker_conn.disconnect()
+            return table_stats
+
+        yield from self._get_table_executor().map(dump_in_worker, jobs)
 
-            db_stats.tables.append(table_stats)
-            db_stats.total_rows += table_stats.rows_dumped
+    @classmethod
+    def _concatenate_files(cls, target: str, parts: list[str]) -> None:
+        """Concatenate part files into `target` in order, removing them.
+
+        Copies in the kernel with os.sendfile where supported, otherwise
+        through shutil.copyfileobj. Concatenated gzip members and zstd
+        frames decompress as one stream.
+        """
+        with open(target, 'wb', buffering=0) as out:
+            for part in parts:
+                with open(part, 'rb', buffering=0) as inp:
+                    offset = 0
+                    if hasattr(os, 'sendfile'):
+                        try:
+                            while sent := os.sendfile(
+                                out.fileno(), inp.fileno(), offset, cls.MERGE_CHUNK_SIZE
+                            ):
+                                offset += sent
+                        except OSError:
+                            pass  # Not supported for these files; copy the rest below
+                    inp.seek(offset)
+                    shutil.copyfileobj(inp, out, cls.MERGE_CHUNK_SIZE)
+                os.unlink(part)
+
+    def _record_table_result(
+        self,
+        table_stats: TableStats,
+        db_stats: DatabaseStats,
+        db_name: str,
+        succeeded: list[str]
+    ) -> None:
+        """Add a table's result to database and overall stats."""
+        db_stats.tables.append(table_stats)
+        db_stats.total_rows += table_stats.rows_dumped
+        with self._stats_lock:
             self.stats.total_tables += 1
             self.stats.total_rows += table_stats.rows_dumped
 
-            self._log_table_result(table_stats, db_name)
+        self._log_table_result(table_stats, db_name, succeeded)
 
     def _get_tables_to_dump(
         self,
@@ -191,88 +591,119 @@ def _get_tables_to_dump(
     ) -> list[dict[str, Any]]:
         """Get list of tables to dump, applying exclusion patterns."""
         tables_config = db_config.get('tables', '*')
-        exclude_patterns = db_config.get('exclude_tables', [])
-        compiled_patterns = self._compile_exclusion_patterns(exclude_patterns) if exclude_patterns else None
+        # Already a tuple when loaded through ConfigLoader; may be null in YAML
+        exclude_patterns = tuple(db_config.get('exclude_tables') or ())
 
         if tables_config == '*':
-            table_names = conn.get_tables()
-            if exclude_patterns:
-                original_count = len(table_names)
-                table_names = [
-                    t for t in table_names
-                    if not self._is_table_excluded(t, exclude_patterns, compiled_patterns)
-                ]
-                excluded_count = original_count - len(table_names)
-                if excluded_count > 0:
-                    logging.info(f"Excluded {excluded_count} table(s) matching exclusion patterns")
-            return [{'name': t} for t in table_names]
-
-        # Explicit table list
-        tables_to_dump = tables_config
-        if exclude_patterns:
-            tables_to_dump = [
-                t for t in tables_to_dump
-                if not self._is_table_excluded(
-                    t['name'] if isinstance(t, dict) else t,
-                    exclude_patterns,
-                    compiled_patterns
-                )
-            ]
+            tables_to_dump = [{'name': t} for t in conn.get_tables()]
+        else:
+            # Explicit table list; bare names are normalized to dicts
+            tables_to_dump = [t if isinstance(t, dict) else {'name': t} for t in tables_config]
+
+        # Common case: nothing to exclude, so skip compilation and filtering
+        if not exclude_patterns:
+            return tables_to_dump
+
+        compiled_patterns = self._compile_exclusions(exclude_patterns)
+        original_count = len(tables_to_dump)
+        tables_to_dump = [
+            t for t in tables_to_dump
+            if not self._is_table_excluded(t['name'], exclude_patterns, compiled_patterns)
+        ]
+        excluded_count = original_count - len(tables_to_dump)
+        if excluded_count > 0:
+            logging.info("Excluded %d table(s) matching exclusion patterns", excluded_count)
         return tables_to_dump
 
     def _dump_single_table(
         self,
-        dumper: TableDumper,
-        table_config: dict[str, Any] | str,
+        conn: DatabaseConnection,
+        table_config: dict[str, Any],
         db_config: dict[str, Any],
-        db_output_dir: Path,
+        path_prefix: str,
         output_format: OutputFormat,
-        separate_files: bool,
-        timestamp: str,
-        is_first: bool
+        single_file_path: Optional[Path],
+        is_first: bool,
+        columns: Optional[list[ColumnInfo]] = None
     ) -> TableStats:
-        """Dump a single table and return stats."""
-        if isinstance(table_config, str):
-            table_config = {'name': table_config}
+        """Dump a single table and return stats.
+
+        Separate files are named `path_prefix` + table name + extension. When
+        `single_file_path` is set, all tables share that file and every table
+        after the first is appended. `columns` is prefetched metadata
+        passed through to the table dumper.
+        """
+        table_name, output_path, settings, append = self._table_dump_args(
+            table_config, db_config, path_prefix, output_format, single_file_path, is_first
+        )
+        return self._dumper.dump_table(
+            conn,
+            table=table_name,
+            output_path=output_path,
+            settings=settings,
+            output_format=output_format,
+            append=append,
+            columns=columns
+        )
 
+    def _table_dump_args(
+        self,
+        table_config: dict[str, Any],
+        db_config: dict[str, Any],
+        path_prefix: str,
+        output_format: OutputFormat,
+        single_file_path: Optional[Path],
+        is_first: bool
+    ) -> tuple[str, Any, DumpSettings, bool]:
+        """Resolve a table's name, output path, settings and append flag."""
         table_name = table_config['name']
         settings = DumpSettings.from_configs(self.defaults, db_config, table_config)
 
+        # %-style arguments so the message is only formatted when DEBUG is on
         logging.debug(
-            f"Table '{table_name}' effective settings: "
-            f"row_limit={settings.row_limit}, order_by={settings.order_by}, "
-            f"order_direction={settings.order_direction}, where_clause={settings.where_clause}"
+            "Table '%s' effective settings: "
+            "row_limit=%s, order_by=%s, order_direction=%s, where_clause=%s",
+            table_name, settings.row_limit, settings.order_by,
+            settings.order_direction, settings.where_clause
         )
 
         # Determine output file path
-        if separate_files:
-            output_path = db_output_dir / f"{table_name}.{output_format.extension}"
+        if single_file_path is None:
+            output_path = f"{path_prefix}{table_name}.{output_format.extension}"
             append = False
         else:
-            # Single file directly in output directory
-            db_name = db_config['name']
-            if self.output_settings.get('timestamp_suffix', True):
-                output_path = db_output_dir / f"{db_name}_{timestamp}.{output_format.extension}"
-            else:
-                output_path = db_output_dir / f"{db_name}.{output_format.extension}"
+            output_path = single_file_path
             append = not is_first
 
-        return dumper.dump_table(
-            table=table_name,
-            output_path=output_path,
-            settings=settings,
-            output_format=output_format,
-            append=append
-        )
+        return table_name, output_path, settings, append
 
-    def _log_table_result(self, table_stats: TableStats, db_name: str) -> None:
-        """Log the result of a table dump."""
+    def _log_table_result(
+        self,
+        table_stats: TableStats,
+        db_name: str,
+        succeeded: list[str]
+    ) -> None:
+        """Log the result of a table dump.
+
+        Successes are collected in `succeeded` and logged as one line per
+        SUCCESS_LOG_BATCH tables; errors are logged and recorded immediately.
+        """
         if table_stats.success:
-            logging.info(f"  ✓ {table_stats.table}: {table_stats.rows_dumped} rows")
+            approximate = '~' if table_stats.rows_approximate else ''
+            succeeded.append(f"{table_stats.table} ({approximate}{table_stats.rows_dumped} rows)")
+            if len(succeeded) >= self.SUCCESS_LOG_BATCH:
+                self._flush_success_log(succeeded, db_name)
         else:
-            logging.error(f"  ✗ {table_stats.table}: {table_stats.error}")
-            self.stats.errors.append({
-                'database': db_name,
-                'table': table_stats.table,
-                'error': table_stats.error
-            })
+            logging.error("  ✗ %s: %s", table_stats.table, table_stats.error)
+            with self._stats_lock:
+                self.stats.errors.append({
+                    'database': db_name,
+                    'table': table_stats.table,
+                    'error': table_stats.error
+                })
+
+    def _flush_success_log(self, succeeded: list[str], db_name: str) -> None:
+        """Log and clear collected successful table results."""
+        if succeeded:
+            logging.info("  ✓ %s: %d table(s): %s", db_name, len(succeeded), ', '.join(succeeded))
+            succeeded.clear()
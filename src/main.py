@@ -32,6 +32,11 @@ def main():
         default='config.yaml',
         help='Path to configuration file (default: config.yaml)'
     )
+    parser.add_argument(
+        '--config-cache',
+        action='store_true',
+        help='Cache the parsed configuration next to the config file (<config>.cache)'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -55,7 +60,7 @@ def main():
 
     # Load configuration
     try:
-        config = ConfigLoader(args.config)
+        config = ConfigLoader(args.config, use_cache=args.config_cache)
     except FileNotFoundError:
         print(f"Error: Configuration file '{args.config}' not found")
         sys.exit(1)
@@ -95,18 +100,18 @@ def main():
         # Print summary
         logging.info("=" * 50)
         logging.info("DUMP COMPLETE")
-        logging.info(f"Databases: {len(stats.databases)}")
-        logging.info(f"Tables: {stats.total_tables}")
-        logging.info(f"Total Rows: {stats.total_rows}")
+        logging.info("Databases: %d", len(stats.databases))
+        logging.info("Tables: %s", stats.total_tables)
+        logging.info("Total Rows: %s", stats.total_rows)
 
         if stats.errors:
-            logging.warning(f"Errors: {len(stats.errors)}")
+            logging.warning("Errors: %d", len(stats.errors))
             for err in stats.errors:
-                logging.warning(f"  - {err['database']}/{err['table']}: {err['error']}")
+                logging.warning("  - %s/%s: %s", err['database'], err['table'], err['error'])
             sys.exit(1)
 
     except Exception as e:
-        logging.error(f"Fatal error: {e}")
+        logging.error("Fatal error: %s", e)
         sys.exit(1)
 
 
@@ -23,7 +23,7 @@ class OrderDirection(Enum):
     DESC = "DESC"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnInfo:
     """Database column metadata."""
     name: str
@@ -34,7 +34,7 @@ class ColumnInfo:
     extra: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TableStats:
     """Statistics for a single table dump."""
     table: str
@@ -42,9 +42,11 @@ class TableStats:
     file_path: str = ""
     success: bool = False
     error: Optional[str] = None
+    # Set when rows_dumped is counted from mysqldump output text
+    rows_approximate: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseStats:
     """Statistics for a single database dump."""
     name: str
@@ -53,7 +55,7 @@ class DatabaseStats:
     total_rows: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DumpStats:
     """Overall dump statistics."""
     databases: list[DatabaseStats] = field(default_factory=list)
@@ -62,7 +64,7 @@ class DumpStats:
     errors: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DumpSettings:
     """Merged settings for dumping a table."""
     row_limit: Optional[int] = None
@@ -80,12 +82,11 @@ def from_configs(
         """
         Create DumpSettings by merging configs with priority: table > database > defaults.
         """
-        settings = {}
-        for key in ['row_limit', 'order_by', 'order_direction', 'where_clause']:
-            if key in defaults:
-                settings[key] = defaults[key]
-            if key in db_config:
-                settings[key] = db_config[key]
-            if key in table_config:
-                settings[key] = table_config[key]
-        return cls(**settings)
+        # Later dicts win; one C-level merge instead of per-key lookups
+        merged = {**defaults, **db_config, **table_config}
+        return cls(
+            row_limit=merged.get('row_limit'),
+            order_by=merged.get('order_by'),
+            order_direction=merged.get('order_direction', 'ASC'),
+            where_clause=merged.get('where_clause'),
+        )
@@ -4,53 +4,240 @@
 
 import csv
 import gzip
+import io
 import logging
-from datetime import datetime
+import os
+import queue
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from datetime import date, datetime, time
+from decimal import Decimal
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional
+
+from mysql.connector.conversion import MySQLConverter
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for compress: "zstd"
+    zstandard = None
+
+try:
+    from isal import igzip
+except ImportError:  # Optional: only needed for compress: "igzip"
+    igzip = None
 
 from .connection import DatabaseConnection
-from .models import DumpSettings, OutputFormat, TableStats
+from .models import ColumnInfo, DumpSettings, OutputFormat, TableStats
+
+
+def _quote_string(value: str) -> str:
+    """Escape and quote a string for SQL INSERT statement.
+
+    Chained str.replace is kept over str.translate: each replace is a
+    C-level scan, while translate with multi-character replacements
+    goes through a per-character lookup and is much slower on text
+    that needs escaping.
+    """
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    escaped = escaped.replace("\n", "\\n").replace("\r", "\\r")
+    # NUL and Ctrl-Z (end of file on Windows) break mysql client imports
+    escaped = escaped.replace("\x00", "\\0").replace("\x1a", "\\Z")
+    return f"'{escaped}'"
+
+
+def _hex_literal(value: bytes | bytearray | memoryview) -> str:
+    """Format binary data as a hex literal."""
+    return f"X'{value.hex()}'"
+
+
+# SQL literal formatters keyed by exact value type, built once at import
+_SQL_TYPE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda v: 'NULL',
+    bool: lambda v: '1' if v else '0',
+    int: str,
+    float: str,
+    # Fixed-point notation; str() gives exponent form for e.g. Decimal('0E-10')
+    Decimal: lambda v: format(v, 'f'),
+    bytes: _hex_literal,
+    bytearray: _hex_literal,
+    memoryview: _hex_literal,
+    # isoformat is several times faster than strftime and keeps fractional
+    # seconds of DATETIME(6) values (omitted when zero)
+    datetime: lambda v: f"'{v.isoformat(' ')}'",
+    date: lambda v: f"'{v.isoformat()}'",
+    time: lambda v: f"'{v.isoformat()}'",
+    str: _quote_string,
+}
+
+# Python type each column type's values normally arrive as, so the
+# formatter can be chosen per column instead of per value
+_COLUMN_VALUE_TYPES: dict[str, type] = {
+    **dict.fromkeys(('tinyint', 'smallint', 'mediumint', 'int', 'integer', 'bigint'), int),
+    **dict.fromkeys(('char', 'varchar', 'tinytext', 'text', 'mediumtext', 'longtext'), str),
+    **dict.fromkeys(
+        ('binary', 'varbinary', 'tinyblob', 'blob', 'mediumblob', 'longblob'), bytes
+    ),
+    **dict.fromkeys(('float', 'double', 'real'), float),
+    **dict.fromkeys(('decimal', 'numeric'), Decimal),
+    # Zero dates arrive as None, which the caller writes as NULL
+    'date': date,
+    **dict.fromkeys(('datetime', 'timestamp'), datetime),
+}
+_BASE_TYPE_PATTERN = re.compile(r'\w+')
+
+
+class _PigzWriter(io.RawIOBase):
+    """Writable stream that compresses through a pigz process into a file.
+
+    Closing waits for pigz to finish and raises OSError if it failed.
+    """
+
+    def __init__(self, command: list[str], output_path: str | Path, file_mode: str):
+        # Set first so close() (also run by the finalizer) works if opening fails
+        self._process = None
+        self._output = None
+        self._output = open(output_path, file_mode)
+        try:
+            self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=self._output)
+        except BaseException:
+            self._output.close()
+            raise
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._process.stdin.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        returncode = 0
+        pipe_error = None
+        try:
+            if self._process is not None:
+                # Always reap pigz, also when it died and closing its stdin fails
+                try:
+                    self._process.stdin.close()
+                except OSError as e:
+                    pipe_error = e
+                finally:
+                    returncode = self._process.wait()
+        finally:
+            if self._output is not None:
+                self._output.close()
+            super().close()
+        if returncode != 0:
+            raise OSError(f"pigz exited with status {returncode}") from pipe_error
+        if pipe_error is not None:
+            raise pipe_error
 
 
 class TableDumper:
-    """Handles dumping of individual tables."""
+    """Handles dumping of individual tables.
+
+    Holds only output settings, so one instance can be shared across
+    databases and threads; the connection is passed to each dump_table call.
+    """
 
     DEFAULT_BATCH_SIZE = 1000
     CSV_BATCH_SIZE = 5000  # Larger batches for CSV as it's simpler
-
-    def __init__(self, connection: DatabaseConnection, output_settings: dict[str, Any]):
-        self.connection = connection
+    DEFAULT_COMPRESS_LEVEL = 1  # Dump text compresses well even at the fastest level
+    DEFAULT_ZSTD_LEVEL = 3
+    DEFAULT_COMPRESS_BUFFER = 256 * 1024  # Bytes buffered before each compression call
+    DEFAULT_WRITE_BUFFER = 1024 * 1024  # Bytes buffered before each write to an uncompressed file
+    COMPRESSION_EXTENSIONS = {'gzip': 'gz', 'igzip': 'gz', 'pigz': 'gz', 'zstd': 'zst'}
+    SQL_HEADER_TEMPLATE = (
+        "-- MySQL Dump\n"
+        "-- Table: {table}\n"
+        "-- Generated: {timestamp}\n"
+        "-- -------------------------------------------------\n\n"
+        "DROP TABLE IF EXISTS `{table}`;\n\n"
+        "{create_statement};\n\n"
+    )
+    # Column types whose values order and compare reliably for keyset paging
+    KEYSET_TYPE_PATTERN = re.compile(
+        r'(tiny|small|medium|big)?int|integer|decimal|numeric|date|datetime|timestamp|year',
+        re.IGNORECASE
+    )
+    MYSQLDUMP_HEADER_TEMPLATE = (
+        "-- MySQL Dump (mysqldump)\n"
+        "-- Table: {table}\n"
+        "-- Generated: {timestamp}\n"
+        "-- -------------------------------------------------\n\n"
+    )
+    MYSQLDUMP_OPTIONS = (
+        '--single-transaction', '--quick', '--skip-lock-tables', '--compact',
+        '--add-drop-table', '--hex-blob', '--no-tablespaces', '--skip-triggers',
+        '--default-character-set=utf8mb4',
+    )
+    MYSQLDUMP_COPY_BUFFER = 1024 * 1024
+    # Shared by all instances; never mutated
+    _type_formatters = _SQL_TYPE_FORMATTERS
+    _quote_string = staticmethod(_quote_string)
+
+    def __init__(self, output_settings: dict[str, Any], dump_timestamp: Optional[str] = None):
         self.output_settings = output_settings
+        # Written into every SQL header; one value for the whole run
+        self.dump_timestamp = dump_timestamp or datetime.now().isoformat()
         self.batch_size = output_settings.get('batch_size', self.DEFAULT_BATCH_SIZE)
-
-        # Pre-build type formatters for faster dispatch
-        self._type_formatters: dict[type, callable] = {
-            type(None): lambda v: 'NULL',
-            bool: lambda v: '1' if v else '0',
-            int: str,
-            float: str,
-            bytes: lambda v: f"X'{v.hex()}'",
-            datetime: lambda v: f"'{v.strftime('%Y-%m-%d %H:%M:%S')}'",
-        }
+        self.compression = self._resolve_compression(output_settings.get('compress', False))
+        self.pigz_path = shutil.which('pigz') if self.compression == 'pigz' else None
+        compress_threads = output_settings.get('compress_threads')
+        if compress_threads is not None and int(compress_threads) < 1:
+            raise ValueError(f"compress_threads must be at least 1, got {compress_threads}")
+        # Threads per pigz process or zstd stream; parallel table dumps share the cores
+        self.compress_threads = int(compress_threads or 0) or max(
+            1, (os.cpu_count() or 1) // max(1, int(output_settings.get('dump_concurrency', 1)))
+        )
+        # 0 compresses in the writing thread instead of a single helper thread
+        self.zstd_threads = self.compress_threads if self.compress_threads > 1 else 0
+        # 0 disables keyset pagination (one streaming SELECT per table)
+        self.keyset_page_size = output_settings.get('keyset_page_size', 0)
+        # 0 keeps one INSERT per fetched batch; otherwise INSERTs are packed by size
+        self.insert_max_bytes = output_settings.get('insert_max_bytes', 0)
+        # 0 fetches in the writing thread; otherwise a reader thread stays this many batches ahead
+        self.prefetch_batches = output_settings.get('prefetch_batches', 0)
+        self.mysqldump_path = None
+        # Whether mysqldump accepts --init-command; probed on first use
+        self._mysqldump_init_command: Optional[bool] = None
+        if output_settings.get('use_mysqldump', False):
+            self.mysqldump_path = shutil.which('mysqldump')
+            if self.mysqldump_path is None:
+                logging.warning(
+                    "use_mysqldump is set but mysqldump was not found; using the built-in dumper"
+                )
+
+        # Everything without a fast formatter (timedelta, ...) is converted
+        # the same way mysql.connector converts query parameters
+        self._converter = MySQLConverter(charset='utf8mb4', use_unicode=True)
 
     def dump_table(
         self,
+        connection: DatabaseConnection,
         table: str,
-        output_path: Path,
+        output_path: str | Path,
         settings: DumpSettings,
         output_format: OutputFormat = OutputFormat.SQL,
-        append: bool = False
+        append: bool = False,
+        columns: Optional[list[ColumnInfo]] = None
     ) -> TableStats:
         """
         Dump a table to file.
 
         Args:
+            connection: Open connection to the table's database.
             table: Name of the table to dump.
             output_path: Path for the output file.
             settings: Dump settings (limits, ordering, filters).
             output_format: Output format (SQL or CSV).
             append: If True, append to existing file instead of overwriting.
+            columns: Prefetched column metadata; queried from the table if None.
 
         Returns:
             TableStats with dump statistics.
@@ -58,11 +245,44 @@ def dump_table(
         stats = TableStats(table=table, file_path=str(output_path))
 
         try:
-            columns = self.connection.get_table_columns(table)
+            if self._can_use_mysqldump(output_format, settings):
+                logging.info("Dumping table '%s' with mysqldump", table)
+                output_path, file_handle = self._open_output_file(output_path, append)
+                stats.file_path = str(output_path)
+                try:
+                    stats.rows_dumped = self._dump_via_mysqldump(
+                        connection, file_handle, table, settings
+                    )
+                    stats.rows_approximate = True
+                    stats.success = True
+                finally:
+                    file_handle.close()
+                return stats
+
+            if columns is None:
+                columns = connection.get_table_columns(table)
             column_names = [col.name for col in columns]
 
-            query = self._build_select_query(table, column_names, settings)
-            logging.info(f"Dumping table '{table}' with query: {query[:200]}...")
+            batch_size = (
+                self.CSV_BATCH_SIZE if output_format == OutputFormat.CSV else self.batch_size
+            )
+            key_column = (
+                self._find_keyset_column(columns, settings) if self.keyset_page_size else None
+            )
+            if key_column:
+                logging.info(
+                    "Dumping table '%s' in pages of %d rows keyed on `%s`",
+                    table, self.keyset_page_size, key_column
+                )
+                batches = self._fetch_keyset_batches(
+                    connection, table, column_names, settings, key_column, batch_size
+                )
+            else:
+                query = self._build_select_query(table, column_names, settings)
+                logging.info("Dumping table '%s' with query: %.200s...", table, query)
+                batches = self._fetch_batches(connection, query, batch_size)
+            if self.prefetch_batches:
+                batches = self._prefetch(batches)
 
             output_path, file_handle = self._open_output_file(output_path, append)
             stats.file_path = str(output_path)
@@ -70,11 +290,12 @@ def dump_table(
             try:
                 if output_format == OutputFormat.SQL:
                     stats.rows_dumped = self._dump_as_sql(
-                        file_handle, table, column_names, query
+                        connection, file_handle, table, column_names, batches,
+                        self._column_formatters(columns)
                     )
                 elif output_format == OutputFormat.CSV:
                     stats.rows_dumped = self._dump_as_csv(
-                        file_handle, table, column_names, query
+                        file_handle, column_names, batches
                     )
                 else:
                     raise ValueError(f"Unsupported output format: {output_format}")
@@ -85,19 +306,203 @@ def dump_table(
 
         except Exception as e:
             stats.error = str(e)
-            logging.error(f"Error dumping table '{table}': {e}")
+            logging.error("Error dumping table '%s': %s", table, e)
 
         return stats
 
-    def _open_output_file(self, output_path: Path, append: bool) -> tuple[Path, TextIO]:
-        """Open output file with optional compression."""
-        file_mode = 'at' if append else 'wt'
+    def _can_use_mysqldump(self, output_format: OutputFormat, settings: DumpSettings) -> bool:
+        """Whether a table can be handed to mysqldump.
+
+        mysqldump writes SQL only and cannot apply row limits or custom
+        ordering, so those dumps stay on the built-in path.
+        """
+        return (
+            self.mysqldump_path is not None
+            and output_format == OutputFormat.SQL
+            and settings.row_limit is None
+            and not settings.order_by
+        )
+
+    def _dump_via_mysqldump(
+        self,
+        connection: DatabaseConnection,
+        file_handle: BinaryIO,
+        table: str,
+        settings: DumpSettings
+    ) -> int:
+        """Stream a table's mysqldump output into the dump file.
+
+        The password goes through a private option file rather than the
+        command line. Returns an approximate number of rows written,
+        counted from the extended INSERT statements.
+        """
+        file_handle.write(self.MYSQLDUMP_HEADER_TEMPLATE.format(
+            table=table, timestamp=self.dump_timestamp
+        ).encode('utf-8'))
+
+        password = (connection.password or '').replace('\\', '\\\\').replace('"', '\\"')
+        with tempfile.NamedTemporaryFile('w', suffix='.cnf') as option_file, \
+                tempfile.TemporaryFile() as stderr:
+            option_file.write(f'[client]\npassword="{password}"\n')
+            option_file.flush()
+
+            # --defaults-extra-file must come first
+            command = [
+                self.mysqldump_path, f'--defaults-extra-file={option_file.name}',
+                f'--host={connection.host}', f'--port={connection.port}',
+                f'--user={connection.user}', *self.MYSQLDUMP_OPTIONS,
+                *self._mysqldump_session_options(connection),
+            ]
+            if settings.where_clause:
+                command.append(f'--where={settings.where_clause}')
+            command += [connection.database, table]
+
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr)
+            try:
+                rows_dumped = self._copy_mysqldump_output(process.stdout, file_handle)
+            finally:
+                process.stdout.close()
+                returncode = process.wait()
+
+            if returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode('utf-8', errors='replace').strip()
+                raise RuntimeError(f"mysqldump exited with status {returncode}: {message}")
+
+        file_handle.write(f"\n-- Dump complete. About {rows_dumped} rows.\n".encode('utf-8'))
+        return rows_dumped
+
+    def _mysqldump_session_options(self, connection: DatabaseConnection) -> list[str]:
+        """mysqldump options for the connection's compress and net_write_timeout.
 
-        if self.output_settings.get('compress', False):
-            output_path = Path(str(output_path) + '.gz')
-            file_handle = gzip.open(output_path, file_mode, encoding='utf-8')
+        --init-command is missing from older mysqldump releases; without it
+        mysqldump keeps its own network timeouts (--network-timeout).
+        """
+        options = ['--compress'] if connection.compress else []
+        if connection.net_write_timeout:
+            if self._mysqldump_init_command is None:
+                try:
+                    help_text = subprocess.run(
+                        [self.mysqldump_path, '--help'], capture_output=True, check=False
+                    ).stdout
+                except OSError:
+                    help_text = b''
+                self._mysqldump_init_command = b'--init-command' in help_text
+                if not self._mysqldump_init_command:
+                    logging.warning(
+                        "mysqldump does not support --init-command; "
+                        "net_write_timeout is not applied to its sessions"
+                    )
+            if self._mysqldump_init_command:
+                options.append(
+                    "--init-command=SET SESSION net_write_timeout = "
+                    f"{int(connection.net_write_timeout)}"
+                )
+        return options
+
+    def _copy_mysqldump_output(self, source: BinaryIO, file_handle: BinaryIO) -> int:
+        """Copy mysqldump output in large chunks, counting dumped rows.
+
+        Each extended INSERT holds one row plus one per "),(" separator; a
+        string value containing that exact sequence is counted as an extra
+        row, so the count is approximate (TableStats.rows_approximate).
+        """
+        rows = 0
+        # Carry each pattern's partial match over chunk boundaries
+        insert_tail = separator_tail = b''
+        while chunk := source.read(self.MYSQLDUMP_COPY_BUFFER):
+            file_handle.write(chunk)
+            data = insert_tail + chunk
+            rows += data.count(b'INSERT INTO ')
+            insert_tail = data[-11:]
+            data = separator_tail + chunk
+            rows += data.count(b'),(')
+            separator_tail = data[-2:]
+        return rows
+
+    @staticmethod
+    def _resolve_compression(compress: Any) -> Optional[str]:
+        """Map the `compress` setting to a codec name ('gzip', 'igzip', 'pigz', 'zstd' or None).
+
+        `true` keeps meaning gzip for backwards compatibility.
+        """
+        if not compress:
+            return None
+        if compress is True:
+            return 'gzip'
+        codec = str(compress).lower()
+        if codec not in TableDumper.COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Unsupported compression: {compress}")
+        if codec == 'zstd' and zstandard is None:
+            raise ValueError(
+                "zstd compression requires the 'zstandard' package (pip install zstandard)"
+            )
+        if codec == 'igzip' and igzip is None:
+            raise ValueError("igzip compression requires the 'isal' package (pip install isal)")
+        if codec == 'pigz' and shutil.which('pigz') is None:
+            raise ValueError("pigz compression requires the 'pigz' binary on PATH")
+        return codec
+
+    def _open_output_file(
+        self,
+        output_path: str | Path,
+        append: bool
+    ) -> tuple[str | Path, BinaryIO]:
+        """Open output file in binary mode with optional compression.
+
+        Writers encode to UTF-8 themselves. Returns the actual path written,
+        of the same type as `output_path`.
+        """
+        file_mode = 'ab' if append else 'wb'
+
+        if self.compression:
+            extension = self.COMPRESSION_EXTENSIONS[self.compression]
+            output_path = type(output_path)(f"{output_path}.{extension}")
+            if self.compression == 'zstd':
+                # Appending writes a new frame; concatenated frames decode as one stream
+                compressor = zstandard.ZstdCompressor(
+                    level=self.output_settings.get('compress_level', self.DEFAULT_ZSTD_LEVEL),
+                    threads=self.zstd_threads
+                )
+                # BufferedWriter needs write() to return the bytes consumed,
+                # which older zstandard releases did not do by default
+                compressed = compressor.stream_writer(
+                    open(output_path, file_mode), write_return_read=True
+                )
+            elif self.compression == 'igzip':
+                # ISA-L gzip: same .gz format, several times faster than zlib
+                compressed = igzip.open(
+                    output_path,
+                    file_mode,
+                    compresslevel=self.output_settings.get(
+                        'compress_level', self.DEFAULT_COMPRESS_LEVEL
+                    )
+                )
+            elif self.compression == 'pigz':
+                # pigz compresses on several cores; appending adds a new gzip member
+                command = [
+                    self.pigz_path, '-c',
+                    f"-{self.output_settings.get('compress_level', self.DEFAULT_COMPRESS_LEVEL)}",
+                    '-p', str(self.compress_threads)
+                ]
+                compressed = _PigzWriter(command, output_path, file_mode)
+            else:
+                compressed = gzip.open(
+                    output_path,
+                    file_mode,
+                    compresslevel=self.output_settings.get(
+                        'compress_level', self.DEFAULT_COMPRESS_LEVEL
+                    )
+                )
+            file_handle = io.BufferedWriter(
+                compressed,
+                buffer_size=self.output_settings.get(
+                    'compress_buffer', self.DEFAULT_COMPRESS_BUFFER
+                )
+            )
         else:
-            file_handle = open(output_path, file_mode[0], encoding='utf-8')
+            # Small INSERT batches are coalesced into ~1 MiB writes
+            file_handle = open(output_path, file_mode, buffering=self.DEFAULT_WRITE_BUFFER)
 
         return output_path, file_handle
 
@@ -118,12 +523,13 @@ def _build_select_query(
             direction = settings.order_direction.upper()
             query += f" ORDER BY `{settings.order_by}` {direction}"
         elif settings.order_by:
-            logging.warning(f"Order column '{settings.order_by}' not found in table '{table}'")
+            logging.warning("Order column '%s' not found in table '%s'", settings.order_by, table)
         elif settings.order_direction != "ASC":
             # User set order_direction but not order_by - warn them
             logging.warning(
-                f"Table '{table}': 'order_direction' is set to '{settings.order_direction}' "
-                f"but 'order_by' is not specified. The order_direction setting will be ignored."
+                "Table '%s': 'order_direction' is set to '%s' but 'order_by' is not specified. "
+                "The order_direction setting will be ignored.",
+                table, settings.order_direction
             )
 
         if settings.row_limit is not None and settings.row_limit >= 0:
@@ -131,70 +537,284 @@ def _build_select_query(
 
         return query
 
-    def _dump_as_sql(
+    def _find_keyset_column(
+        self,
+        columns: list[ColumnInfo],
+        settings: DumpSettings
+    ) -> Optional[str]:
+        """
+        Find a column to keyset-paginate on, or None to use a single SELECT.
+
+        Requires a single-column numeric or temporal primary key, and no
+        order_by other than that key ascending.
+        """
+        primary = [col for col in columns if col.key == 'PRI']
+        if len(primary) != 1 or not self.KEYSET_TYPE_PATTERN.match(primary[0].type):
+            return None
+
+        key = primary[0].name
+        if settings.order_by and (
+            settings.order_by != key or settings.order_direction.upper() != 'ASC'
+        ):
+            return None
+        return key
+
+    def _fetch_batches(
         self,
-        file_handle: TextIO,
+        connection: DatabaseConnection,
+        query: str,
+        batch_size: int
+    ) -> Iterator[list[tuple]]:
+        """Execute a query lazily and yield its rows in batches."""
+        cursor = connection.get_cursor(fetch_size=batch_size)
+        try:
+            cursor.execute(query)
+            while batch := cursor.fetchmany(batch_size):
+                yield batch
+        finally:
+            connection.close_cursor(cursor)
+
+    def _prefetch(self, batches: Iterator[list[tuple]]) -> Iterator[list[tuple]]:
+        """Fetch batches in a background thread, up to `prefetch_batches` ahead.
+
+        Reading the next batch from MySQL overlaps formatting, compressing
+        and writing the current one. The thread starts on first iteration,
+        after the writer's metadata queries on the same connection, and is
+        stopped (closing `batches`) if the consumer finishes early.
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=self.prefetch_batches)
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            end = done
+            try:
+                for batch in batches:
+                    if not put(batch):
+                        break
+                batches.close()
+            except Exception as e:
+                end = e
+            put(end)
+
+        thread = threading.Thread(target=produce, name="table-prefetch", daemon=True)
+        thread.start()
+        try:
+            while (item := buffer.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+
+    def _fetch_keyset_batches(
+        self,
+        connection: DatabaseConnection,
         table: str,
         columns: list[str],
-        query: str
-    ) -> int:
-        """Dump table data as SQL INSERT statements."""
-        # Write header
-        file_handle.write(f"-- MySQL Dump\n")
-        file_handle.write(f"-- Table: {table}\n")
-        file_handle.write(f"-- Generated: {datetime.now().isoformat()}\n")
-        file_handle.write(f"-- -------------------------------------------------\n\n")
-
-        # Write CREATE TABLE statement
-        create_statement = self.connection.get_create_table(table)
-        file_handle.write(f"DROP TABLE IF EXISTS `{table}`;\n\n")
-        file_handle.write(f"{create_statement};\n\n")
-
-        # Write data
-        cursor = self.connection.get_cursor()
-        cursor.execute(query)
+        settings: DumpSettings,
+        key_column: str,
+        batch_size: int
+    ) -> Iterator[list[tuple]]:
+        """
+        Yield a table's rows in batches using keyset pagination.
 
-        rows_dumped = 0
-        batch = []
-        quoted_columns = ', '.join([f'`{col}`' for col in columns])
+        Each page is a bounded `WHERE key > last ORDER BY key LIMIT n` query,
+        so no single statement has to stream the whole table. Honors the
+        where_clause and row_limit settings.
+        """
+        key_index = columns.index(key_column)
+        quoted_columns = ', '.join(f'`{col}`' for col in columns)
+        remaining = (
+            settings.row_limit
+            if settings.row_limit is not None and settings.row_limit >= 0
+            else None
+        )
+        last_key = None
+
+        while remaining is None or remaining > 0:
+            page_size = (
+                self.keyset_page_size if remaining is None
+                else min(self.keyset_page_size, remaining)
+            )
 
-        for row in cursor:
-            batch.append(row)
-            rows_dumped += 1
+            conditions = []
+            if settings.where_clause:
+                conditions.append(f"({settings.where_clause})")
+            if last_key is not None:
+                conditions.append(f"`{key_column}` > {self._keyset_literal(last_key)}")
+
+            query = f"SELECT {quoted_columns} FROM `{table}`"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += f" ORDER BY `{key_column}` ASC LIMIT {page_size}"
+
+            fetched = 0
+            for batch in self._fetch_batches(connection, query, batch_size):
+                fetched += len(batch)
+                last_key = batch[-1][key_index]
+                yield batch
+
+            if fetched < page_size:
+                break
+            if remaining is not None:
+                remaining -= fetched
+
+    def _keyset_literal(self, value: Any) -> str:
+        """Format a key value for a keyset WHERE condition, keeping full precision."""
+        if type(value) is int:
+            return str(value)
+        if isinstance(value, Decimal):
+            # Unquoted, so MySQL compares exactly instead of as DOUBLE
+            return format(value, 'f')
+        converter = self._converter
+        return bytes(converter.quote(converter.escape(converter.to_mysql(value)))).decode('utf-8')
 
-            if len(batch) >= self.batch_size:
-                self._write_insert_batch(file_handle, table, quoted_columns, batch)
-                batch = []
+    def _dump_as_sql(
+        self,
+        connection: DatabaseConnection,
+        file_handle: BinaryIO,
+        table: str,
+        columns: list[str],
+        batches: Iterable[list[tuple]],
+        formatters: Optional[list[Callable[[Any], str]]] = None
+    ) -> int:
+        """Dump table data as SQL INSERT statements.
+
+        `formatters` holds one value formatter per column (see
+        _column_formatters); by default every value is dispatched on its type.
+        """
+        # Header, DROP and CREATE TABLE go out as one pre-encoded write
+        create_statement = connection.get_create_table(table)
+        file_handle.write(self.SQL_HEADER_TEMPLATE.format(
+            table=table, timestamp=self.dump_timestamp, create_statement=create_statement
+        ).encode('utf-8'))
 
-        # Write remaining rows
-        if batch:
-            self._write_insert_batch(file_handle, table, quoted_columns, batch)
+        quoted_columns = ', '.join([f'`{col}`' for col in columns])
+        insert_prefix = f"INSERT INTO `{table}` ({quoted_columns}) VALUES\n".encode('utf-8')
 
-        cursor.close()
+        if self.insert_max_bytes:
+            # Statements must also fit the server's packet limit on restore
+            max_bytes = min(self.insert_max_bytes, connection.get_max_allowed_packet())
+            rows_dumped = self._write_sized_inserts(
+                file_handle, insert_prefix, batches, formatters, max_bytes
+            )
+        else:
+            # Stream data; each fetched batch becomes one INSERT statement
+            rows_dumped = 0
+            for batch in batches:
+                self._write_insert_batch(file_handle, insert_prefix, batch, formatters)
+                rows_dumped += len(batch)
 
-        file_handle.write(f"\n-- Dump complete. {rows_dumped} rows.\n")
+        file_handle.write(f"\n-- Dump complete. {rows_dumped} rows.\n".encode('utf-8'))
         return rows_dumped
 
     def _write_insert_batch(
         self,
-        file_handle: TextIO,
-        table: str,
-        columns: str,
-        rows: list[tuple]
+        file_handle: BinaryIO,
+        insert_prefix: bytes,
+        rows: list[tuple],
+        formatters: Optional[list[Callable[[Any], str]]] = None
     ) -> None:
-        """Write a batch of rows as INSERT statement."""
+        """Write a batch of rows as one INSERT statement.
+
+        `insert_prefix` is the encoded "INSERT INTO ... VALUES" line, built
+        once per table. `formatters` are per-column value formatters.
+        """
         if not rows:
             return
 
-        file_handle.write(f"INSERT INTO `{table}` ({columns}) VALUES\n")
+        value_lines = ',\n'.join(self._format_rows(rows, formatters))
+
+        # One write per batch
+        file_handle.write(insert_prefix + value_lines.encode('utf-8') + b';\n\n')
 
-        value_lines = [
-            f"  ({', '.join(self._format_sql_value(val) for val in row)})"
+    def _write_sized_inserts(
+        self,
+        file_handle: BinaryIO,
+        insert_prefix: bytes,
+        batches: Iterable[list[tuple]],
+        formatters: Optional[list[Callable[[Any], str]]],
+        max_bytes: int
+    ) -> int:
+        """Write rows as INSERT statements of at most `max_bytes` each.
+
+        Rows are packed across fetched batches; a single row larger than
+        the limit gets a statement of its own. Returns the rows written.
+        """
+        # Room left for values after the prefix and the ";\n\n" terminator
+        limit = max_bytes - len(insert_prefix) - 3
+        pending: list[bytes] = []
+        size = 0
+        rows_dumped = 0
+
+        for batch in batches:
+            for line in self._format_rows(batch, formatters):
+                encoded = line.encode('utf-8')
+                if pending and size + len(encoded) > limit:
+                    file_handle.write(insert_prefix + b',\n'.join(pending) + b';\n\n')
+                    pending = []
+                    size = 0
+                pending.append(encoded)
+                size += len(encoded) + 2  # ",\n" separator
+            rows_dumped += len(batch)
+
+        if pending:
+            file_handle.write(insert_prefix + b',\n'.join(pending) + b';\n\n')
+        return rows_dumped
+
+    def _format_rows(
+        self,
+        rows: list[tuple],
+        formatters: Optional[list[Callable[[Any], str]]] = None
+    ) -> list[str]:
+        """Format rows as "  (v1, v2, ...)" value lines."""
+        if not rows:
+            return []
+        if formatters is None:
+            formatters = [self._format_sql_value] * len(rows[0])
+        return [
+            "  (" + ', '.join([
+                'NULL' if val is None else fmt(val) for fmt, val in zip(formatters, row)
+            ]) + ")"
             for row in rows
         ]
 
-        file_handle.write(',\n'.join(value_lines))
-        file_handle.write(';\n\n')
+    def _column_formatters(self, columns: list[ColumnInfo]) -> list[Callable[[Any], str]]:
+        """Choose one SQL value formatter per column from its declared type.
+
+        Numeric, text, binary, DATE and DATETIME columns get a fixed
+        formatter; any other column (TIME, SET, JSON, ...) keeps per-value
+        type dispatch. NULLs are handled by the caller.
+        """
+        formatters = []
+        for col in columns:
+            base_type = _BASE_TYPE_PATTERN.match(col.type)
+            value_type = _COLUMN_VALUE_TYPES.get(base_type.group().lower()) if base_type else None
+            formatters.append(
+                self._fixed_formatter(value_type) if value_type else self._format_sql_value
+            )
+        return formatters
+
+    def _fixed_formatter(self, value_type: type) -> Callable[[Any], str]:
+        """Format values of `value_type` directly and dispatch any other value.
+
+        Drivers do not always return the expected type (e.g. bytearray for
+        text with a binary collation), so other values take the slow path.
+        """
+        formatter = self._type_formatters[value_type]
+        fallback = self._format_sql_value
+        return lambda value: formatter(value) if type(value) is value_type else fallback(value)
 
     def _format_sql_value(self, value: Any) -> str:
         """Format a value for SQL INSERT statement.
@@ -206,42 +826,36 @@ def _format_sql_value(self, value: Any) -> str:
         if formatter:
             return formatter(value)
 
-        # Slow path: string conversion with escaping
-        escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
-        escaped = escaped.replace("\n", "\\n").replace("\r", "\\r")
-        return f"'{escaped}'"
+        # Slow path: let mysql.connector convert, escape and quote the value
+        converter = self._converter
+        try:
+            converted = converter.to_mysql(value)
+        except TypeError:
+            # No MySQL conversion for this type; dump its string form
+            return self._quote_string(str(value))
+        return bytes(converter.quote(converter.escape(converted))).decode('utf-8')
 
     def _dump_as_csv(
         self,
-        file_handle: TextIO,
-        table: str,
+        file_handle: BinaryIO,
         columns: list[str],
-        query: str
+        batches: Iterable[list[tuple]]
     ) -> int:
         """Dump table data as CSV with batched writes for better performance."""
-        writer = csv.writer(file_handle, quoting=csv.QUOTE_MINIMAL)
-
-        # Write header
-        writer.writerow(columns)
-
-        # Write data in batches for better I/O performance
-        cursor = self.connection.get_cursor()
-        cursor.execute(query)
-
-        rows_dumped = 0
-        batch = []
+        # csv needs a text stream; detach afterwards so the caller closes the file
+        text_handle = io.TextIOWrapper(file_handle, encoding='utf-8', newline='')
+        try:
+            writer = csv.writer(text_handle, quoting=csv.QUOTE_MINIMAL)
 
-        for row in cursor:
-            batch.append(row)
-            rows_dumped += 1
+            # Write header
+            writer.writerow(columns)
 
-            if len(batch) >= self.CSV_BATCH_SIZE:
+            # Write data in batches for better I/O performance
+            rows_dumped = 0
+            for batch in batches:
                 writer.writerows(batch)
-                batch = []
-
-        # Write remaining rows
-        if batch:
-            writer.writerows(batch)
-
-        cursor.close()
+                rows_dumped += len(batch)
+        finally:
+            text_handle.flush()
+            text_handle.detach()
         return rows_dumped
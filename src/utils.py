@@ -33,11 +33,13 @@ def setup_logging(log_settings: dict[str, Any]) -> None:
 def print_dry_run_info(databases: list[dict[str, Any]], defaults: dict[str, Any]) -> None:
     """Print information about what would be dumped in dry-run mode."""
     for db in databases:
-        logging.info(f"Would dump database: {db['name']} from instance: {db.get('instance', 'primary')}")
+        logging.info(
+            "Would dump database: %s from instance: %s", db['name'], db.get('instance', 'primary')
+        )
 
         db_row_limit = db.get('row_limit')
         if db_row_limit is not None:
-            logging.info(f"  Database-level row_limit: {db_row_limit}")
+            logging.info("  Database-level row_limit: %s", db_row_limit)
 
         tables = db.get('tables', '*')
         if tables == '*':
@@ -49,11 +51,11 @@ def print_dry_run_info(databases: list[dict[str, Any]], defaults: dict[str, Any]
                     settings_parts = format_settings_display(settings)
 
                     if settings_parts:
-                        logging.info(f"  - {t['name']} ({', '.join(settings_parts)})")
+                        logging.info("  - %s (%s)", t['name'], ', '.join(settings_parts))
                     else:
-                        logging.info(f"  - {t['name']} (no limits)")
+                        logging.info("  - %s (no limits)", t['name'])
                 else:
-                    logging.info(f"  - {t}")
+                    logging.info("  - %s", t)
 
 
 def format_settings_display(settings: DumpSettings) -> list[str]:
@@ -10,7 +10,7 @@
 import pytest
 import yaml
 
-from src.config import ConfigLoader
+from src.config import ConfigLoader, SafeLoader
 
 
 class TestConfigLoader:
@@ -107,6 +107,24 @@ def test_get_databases(self, config_file):
         assert databases[0]["name"] == "testdb"
         assert databases[1]["name"] == "analytics"
 
+    def test_exclude_tables_frozen(self):
+        """Test exclude_tables lists are stored as tuples."""
+        config = {"databases": [
+            {"name": "db1", "exclude_tables": ["tmp_*", "*_old"]},
+            {"name": "db2"},
+        ]}
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.yaml', delete=False
+        ) as f:
+            yaml.dump(config, f)
+            f.flush()
+            loader = ConfigLoader(f.name)
+        os.unlink(f.name)
+
+        databases = loader.get_databases()
+        assert databases[0]["exclude_tables"] == ("tmp_*", "*_old")
+        assert "exclude_tables" not in databases[1]
+
     def test_get_defaults(self, config_file):
         """Test getting default settings."""
         loader = ConfigLoader(config_file)
@@ -244,6 +262,35 @@ def test_env_var_in_nested_list(self):
 
         os.unlink(config_path)
 
+    def test_multiple_env_vars_in_one_string(self):
+        """Test several placeholders in one string are all resolved."""
+        with mock.patch.dict(os.environ, {"USER_A": "alice", "HOST_A": "db"}, clear=True):
+            loader = ConfigLoader.__new__(ConfigLoader)
+            resolved = loader._resolve_env_vars("${USER_A}@${HOST_A}:${USER_A}/${MISSING}")
+
+        assert resolved == "alice@db:alice/"
+
+    def test_env_var_looked_up_once_per_load(self):
+        """Test a variable repeated across strings is read from the environment once."""
+        config = {"a": "${REPEATED_VAR}", "b": ["${REPEATED_VAR}/x", "${REPEATED_VAR}"]}
+        loader = ConfigLoader.__new__(ConfigLoader)
+        with mock.patch('src.config.os.environ') as mock_environ:
+            mock_environ.get.return_value = "v"
+            loader._resolve_env_vars(config)
+
+        assert config == {"a": "v", "b": ["v/x", "v"]}
+        mock_environ.get.assert_called_once_with("REPEATED_VAR", '')
+
+    def test_resolves_in_place(self):
+        """Test nested containers are resolved in place."""
+        config = {"a": [{"b": "${NESTED_VAR}"}, ["${NESTED_VAR}", 1]], "c": None}
+        with mock.patch.dict(os.environ, {"NESTED_VAR": "x"}):
+            loader = ConfigLoader.__new__(ConfigLoader)
+            resolved = loader._resolve_env_vars(config)
+
+        assert resolved is config
+        assert config == {"a": [{"b": "x"}, ["x", 1]], "c": None}
+
     def test_non_string_values_unchanged(self):
         """Test that non-string values are not modified."""
         config = {
@@ -268,3 +315,90 @@ def test_non_string_values_unchanged(self):
         assert instance["port"] == 3306
         assert instance["ssl"] is True
         assert instance["timeout"] is None
+
+
+class TestYamlLoader:
+    """Tests for YAML loader selection."""
+
+    def test_uses_safe_loader(self):
+        """Test the selected loader is a safe loader variant."""
+        assert SafeLoader in (yaml.SafeLoader, getattr(yaml, "CSafeLoader", None))
+
+    def test_warns_once_without_c_loader(self, tmp_path, caplog):
+        """Test a missing C loader is reported on the first parse only."""
+        path = tmp_path / "config.yaml"
+        path.write_text("instances: {}\n")
+
+        with mock.patch('src.config._warn_pure_python_loader', True):
+            ConfigLoader(str(path))
+            ConfigLoader(str(path))
+
+        warnings = [r for r in caplog.records if "libyaml" in r.getMessage()]
+        assert len(warnings) == 1
+
+    def test_rejects_python_tags(self, tmp_path):
+        """Test arbitrary Python objects cannot be constructed."""
+        path = tmp_path / "config.yaml"
+        path.write_text("evil: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(yaml.YAMLError):
+            ConfigLoader(str(path))
+
+
+class TestConfigCache:
+    """Tests for the parsed-config cache."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """Create a config file in a temporary directory."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({
+            "instances": {"primary": {"host": "localhost", "password": "${CACHE_PW}"}}
+        }))
+        return str(path)
+
+    def test_cache_disabled_by_default(self, config_file):
+        """Test no cache file is written unless requested."""
+        ConfigLoader(config_file)
+        assert not os.path.exists(config_file + ".cache")
+
+    def test_cache_written_and_reused(self, config_file):
+        """Test the cache is written once and reused while the file is unchanged."""
+        ConfigLoader(config_file, use_cache=True)
+        assert os.path.exists(config_file + ".cache")
+
+        with mock.patch('src.config.yaml.load') as mock_load:
+            loader = ConfigLoader(config_file, use_cache=True)
+            mock_load.assert_not_called()
+
+        assert loader.get_instance("primary")["host"] == "localhost"
+
+    def test_cache_stores_unresolved_values(self, config_file):
+        """Test env var values are resolved after loading, never cached."""
+        with mock.patch.dict(os.environ, {"CACHE_PW": "first"}):
+            ConfigLoader(config_file, use_cache=True)
+
+        with open(config_file + ".cache", 'rb') as f:
+            assert b"first" not in f.read()
+
+        with mock.patch.dict(os.environ, {"CACHE_PW": "second"}):
+            loader = ConfigLoader(config_file, use_cache=True)
+        assert loader.get_instance("primary")["password"] == "second"
+
+    def test_stale_cache_ignored(self, config_file):
+        """Test editing the config invalidates the cache."""
+        ConfigLoader(config_file, use_cache=True)
+
+        with open(config_file, 'w') as f:
+            yaml.dump({"instances": {"primary": {"host": "db.example.com"}}}, f)
+
+        loader = ConfigLoader(config_file, use_cache=True)
+        assert loader.get_instance("primary")["host"] == "db.example.com"
+
+    def test_corrupt_cache_ignored(self, config_file):
+        """Test an unreadable cache falls back to parsing YAML."""
+        with open(config_file + ".cache", 'wb') as f:
+            f.write(b"not marshal data")
+
+        loader = ConfigLoader(config_file, use_cache=True)
+        assert loader.get_instance("primary")["host"] == "localhost"
@@ -5,6 +5,8 @@
 from unittest import mock
 
 import pytest
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import CNX_POOL_MAXSIZE
 
 from src.connection import DatabaseConnection
 from src.models import ColumnInfo
@@ -56,9 +58,25 @@ def test_connect(self, mock_connect):
             password="secret",
             database="testdb",
             charset='utf8mb4',
-            use_unicode=True
+            use_unicode=True,
+            compress=False
         )
         assert conn.connection == mock_connection
+        mock_connection.cmd_query.assert_called_once_with(
+            "SET SESSION net_write_timeout = 3600"
+        )
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_connect_session_options(self, mock_connect):
+        """Test protocol compression and net_write_timeout are configurable."""
+        conn = DatabaseConnection(
+            "localhost", 3306, "root", "secret", compress=True, net_write_timeout=None
+        )
+        conn.connect()
+
+        kwargs = mock_connect.call_args.kwargs
+        assert kwargs["compress"] is True
+        mock_connect.return_value.cmd_query.assert_not_called()
 
     @mock.patch('src.connection.mysql.connector.connect')
     def test_disconnect(self, mock_connect):
@@ -129,6 +147,33 @@ def test_execute_query(self, mock_connect):
 
         assert result == [("row1",), ("row2",)]
         mock_cursor.execute.assert_called_once_with("SELECT * FROM test", None)
+        mock_cursor.close.assert_not_called()
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_execute_query_reuses_cursor(self, mock_connect):
+        """Test metadata queries share one buffered cursor until disconnect."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchall.return_value = []
+
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connection.is_connected.return_value = True
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection(
+            host="localhost",
+            port=3306,
+            user="root",
+            password="secret"
+        )
+        conn.connect()
+        conn.execute_query("SHOW TABLES")
+        conn.execute_query("DESCRIBE `users`")
+
+        mock_connection.cursor.assert_called_once_with(buffered=True)
+        assert mock_cursor.execute.call_count == 2
+
+        conn.disconnect()
         mock_cursor.close.assert_called_once()
 
     @mock.patch('src.connection.mysql.connector.connect')
@@ -158,6 +203,71 @@ def test_execute_query_with_params(self, mock_connect):
             (1,)
         )
 
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_close_cursor_discards_unread_rows(self, mock_connect):
+        """Test an abandoned stream is killed before its cursor is closed."""
+        mock_cursor = mock.MagicMock()
+
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connection.unread_result = True
+        mock_connection.connection_id = 42
+        killer = mock.MagicMock()
+        mock_connect.side_effect = [mock_connection, killer]
+
+        conn = DatabaseConnection(
+            host="localhost",
+            port=3306,
+            user="root",
+            password="secret",
+            compress=True
+        )
+        conn.connect()
+        conn.close_cursor(conn.get_cursor())
+
+        killer.cmd_query.assert_called_once_with("KILL QUERY 42")
+        killer.close.assert_called_once()
+        kill_kwargs = mock_connect.call_args.kwargs
+        assert kill_kwargs["connection_timeout"] == DatabaseConnection.KILL_CONNECT_TIMEOUT
+        assert kill_kwargs["compress"] is True
+        mock_connection.consume_results.assert_called_once()
+        mock_cursor.close.assert_called_once()
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_close_cursor_fully_read(self, mock_connect):
+        """Test a fully read stream is closed without killing anything."""
+        mock_cursor = mock.MagicMock()
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connection.unread_result = False
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection("localhost", 3306, "root", "secret")
+        conn.connect()
+        conn.close_cursor(conn.get_cursor())
+
+        mock_connect.assert_called_once()
+        mock_connection.consume_results.assert_not_called()
+        mock_cursor.close.assert_called_once()
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_get_cursor_fetch_size(self, mock_connect):
+        """Test fetch_size sets the cursor's fetchmany default."""
+        mock_connection = mock.MagicMock()
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection(
+            host="localhost",
+            port=3306,
+            user="root",
+            password="secret"
+        )
+        conn.connect()
+        cursor = conn.get_cursor(fetch_size=500)
+
+        mock_connection.cursor.assert_called_once_with(buffered=False)
+        assert cursor.arraysize == 500
+
     @mock.patch('src.connection.mysql.connector.connect')
     def test_get_tables(self, mock_connect):
         """Test getting list of tables."""
@@ -183,6 +293,73 @@ def test_get_tables(self, mock_connect):
         assert tables == ["users", "orders", "products"]
         mock_cursor.execute.assert_called_once_with("SHOW TABLES", None)
 
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_get_all_columns(self, mock_connect):
+        """Test column metadata for all tables is grouped by table."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchall.return_value = [
+            ("orders", "id", "int(11)", "NO", "PRI", None, "auto_increment"),
+            ("orders", "total", "decimal(10,2)", "YES", "", None, ""),
+            ("users", "id", "int(11)", "NO", "PRI", None, "auto_increment"),
+        ]
+
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection(
+            host="localhost",
+            port=3306,
+            user="root",
+            password="secret",
+            database="testdb"
+        )
+        conn.connect()
+        columns = conn.get_all_columns("testdb")
+
+        assert list(columns) == ["orders", "users"]
+        assert [c.name for c in columns["orders"]] == ["id", "total"]
+        assert columns["orders"][1] == ColumnInfo("total", "decimal(10,2)", "YES", "", None, "")
+        query, params = mock_cursor.execute.call_args.args
+        assert "information_schema.COLUMNS" in query
+        assert params == ("testdb",)
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_get_table_columns_decodes_bytes(self, mock_connect):
+        """Test DESCRIBE rows returned as bytes give str column types."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchall.return_value = [
+            (b"id", b"bigint(20) unsigned", b"NO", b"PRI", None, b""),
+        ]
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection("localhost", 3306, "root", "secret", "testdb")
+        conn.connect()
+
+        assert conn.get_table_columns("users") == [
+            ColumnInfo("id", "bigint(20) unsigned", "NO", "PRI", None, "")
+        ]
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_get_all_columns_decodes_bytes(self, mock_connect):
+        """Test column metadata returned as bytes is decoded to str."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchall.return_value = [
+            ("users", b"id", b"int(11)", b"NO", b"PRI", None, b"auto_increment"),
+        ]
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection("localhost", 3306, "root", "secret", "testdb")
+        conn.connect()
+
+        assert conn.get_all_columns("testdb")["users"] == [
+            ColumnInfo("id", "int(11)", "NO", "PRI", None, "auto_increment")
+        ]
+
     @mock.patch('src.connection.mysql.connector.connect')
     def test_get_table_columns(self, mock_connect):
         """Test getting column information for a table."""
@@ -215,6 +392,69 @@ def test_get_table_columns(self, mock_connect):
         assert columns[1].name == "name"
         assert columns[1].nullable == "YES"
 
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_get_max_allowed_packet(self, mock_connect):
+        """Test max_allowed_packet is queried once per connection."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchall.return_value = [(67108864,)]
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection("localhost", 3306, "root", "secret", "testdb")
+        conn.connect()
+
+        assert conn.get_max_allowed_packet() == 67108864
+        assert conn.get_max_allowed_packet() == 67108864
+        mock_cursor.execute.assert_called_once_with("SELECT @@max_allowed_packet", None)
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_table_metadata_cached_until_disconnect(self, mock_connect):
+        """Test DESCRIBE and SHOW CREATE TABLE run once per table per session."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchall.side_effect = [
+            [("id", "int(11)", "NO", "PRI", None, "")],
+            [("users", "CREATE TABLE `users` (`id` int)")],
+            [("id", "int(11)", "NO", "PRI", None, "")],
+        ]
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection("localhost", 3306, "root", "secret", "testdb")
+        conn.connect()
+        first = conn.get_table_columns("users")
+        assert conn.get_table_columns("users") is first
+        assert conn.get_create_table("users") == "CREATE TABLE `users` (`id` int)"
+        assert conn.get_create_table("users") == "CREATE TABLE `users` (`id` int)"
+        assert mock_cursor.execute.call_count == 2
+
+        conn.disconnect()
+        conn.connect()
+        conn.get_table_columns("users")
+        assert mock_cursor.execute.call_count == 3
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_use_database_clears_metadata(self, mock_connect):
+        """Test switching databases reuses the session and drops cached metadata."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchall.return_value = [("id", "int(11)", "NO", "PRI", None, "")]
+        mock_connection = mock.MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+
+        conn = DatabaseConnection("localhost", 3306, "root", "secret", "db1")
+        conn.connect()
+        conn.get_table_columns("users")
+        conn.use_database("db1")
+        conn.use_database("db2")
+        conn.get_table_columns("users")
+
+        mock_connection.cmd_init_db.assert_called_once_with("db2")
+        assert conn.database == "db2"
+        assert mock_cursor.execute.call_count == 2
+        mock_connect.assert_called_once()
+
     @mock.patch('src.connection.mysql.connector.connect')
     def test_get_cursor(self, mock_connect):
         """Test getting a cursor."""
@@ -254,3 +494,84 @@ def test_connect_error(self, mock_connect):
 
         with pytest.raises(MySQLError):
             conn.connect()
+
+
+class TestConnectionPooling:
+    """Tests for pooled connection helpers."""
+
+    @mock.patch('src.connection.MySQLConnectionPool')
+    def test_create_pool(self, mock_pool_class):
+        """Test pool creation passes connection settings."""
+        DatabaseConnection.create_pool(
+            host="localhost",
+            port=3306,
+            user="root",
+            password="secret",
+            pool_size=4
+        )
+
+        mock_pool_class.assert_called_once_with(
+            pool_size=4,
+            pool_reset_session=False,
+            host="localhost",
+            port=3306,
+            user="root",
+            password="secret",
+            charset='utf8mb4',
+            use_unicode=True,
+            compress=False
+        )
+
+    @mock.patch('src.connection.MySQLConnectionPool')
+    def test_create_pool_caps_size(self, mock_pool_class):
+        """Test pool size is capped at the mysql.connector maximum."""
+        DatabaseConnection.create_pool("localhost", 3306, "root", "secret", pool_size=1000)
+
+        assert mock_pool_class.call_args.kwargs['pool_size'] == CNX_POOL_MAXSIZE
+
+    def test_close_pool_disconnects_connections(self):
+        """Test closing a pool checks out and disconnects every connection."""
+        first, second = mock.MagicMock(), mock.MagicMock()
+        pool = mock.MagicMock()
+        pool.get_connection.side_effect = [first, second, PoolError("exhausted")]
+
+        DatabaseConnection.close_pool(pool)
+
+        first.disconnect.assert_called_once()
+        second.disconnect.assert_called_once()
+        first.close.assert_not_called()
+
+    @mock.patch('src.connection.mysql.connector.connect')
+    def test_from_pooled_skips_connect(self, mock_connect):
+        """Test wrapping a pooled connection does not open a new one."""
+        pooled = mock.MagicMock()
+        pooled.server_host = "localhost"
+        pooled.server_port = 3306
+        pooled.user = "root"
+
+        conn = DatabaseConnection.from_pooled(pooled, database="testdb")
+        with conn:
+            assert conn.connection is pooled
+            assert conn.database == "testdb"
+
+        mock_connect.assert_not_called()
+        pooled.cmd_query.assert_called_once_with("SET SESSION net_write_timeout = 3600")
+        pooled.close.assert_called_once()
+        assert conn.connection is None
+
+    @mock.patch.object(DatabaseConnection, '_configured_sessions', set())
+    def test_from_pooled_configures_session_once(self):
+        """Test session settings run once per physical connection, not per checkout."""
+        pooled = mock.MagicMock()
+        pooled.server_host = "localhost"
+        pooled.server_port = 3306
+        pooled.connection_id = 7
+
+        DatabaseConnection.from_pooled(pooled)
+        DatabaseConnection.from_pooled(pooled)
+        pooled.cmd_query.assert_called_once_with("SET SESSION net_write_timeout = 3600")
+
+        # The pool reconnected it: a new session needs the settings again
+        pooled.connection_id = 8
+        DatabaseConnection.from_pooled(pooled)
+        assert pooled.cmd_query.call_count == 2
@@ -3,19 +3,57 @@
 """
 
 import fnmatch
+import gzip
+import logging
+import os
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
 import pytest
+from mysql.connector.errors import PoolError
 
 from src.database_dumper import DatabaseDumper
-from src.models import DatabaseStats, DumpStats
+from src.models import ColumnInfo, DatabaseStats, DumpStats, OutputFormat, TableStats
 
 
-class TestCompileExclusionPatterns:
-    """Tests for _compile_exclusion_patterns method."""
+class TestCompileExclusions:
+    """Tests for _compile_exclusions method."""
+
+    def test_compile_returns_single_pattern(self):
+        """Test patterns are fused into one compiled regex."""
+        compiled = DatabaseDumper._compile_exclusions(("*_backup", "tmp_*"))
+        assert isinstance(compiled, re.Pattern)
+
+    def test_compiled_pattern_matches(self):
+        """Test the fused regex matches any of its patterns."""
+        compiled = DatabaseDumper._compile_exclusions(("*_backup", "tmp_*"))
+
+        # Test matches
+        assert compiled.match("users_backup")
+        assert compiled.match("tmp_data")
+
+        # Test non-matches
+        assert not compiled.match("users")
+        assert not compiled.match("data_tmp")
+        assert not compiled.match("users_backup_2024")
+
+    def test_reports_matching_pattern(self):
+        """Test the matching branch identifies the original pattern."""
+        compiled = DatabaseDumper._compile_exclusions(("*_backup", "tmp_*"))
+        assert compiled.match("tmp_data").lastgroup == "p1"
+
+    def test_compile_is_cached(self):
+        """Test identical pattern tuples reuse the compiled regex."""
+        first = DatabaseDumper._compile_exclusions(("*_old", "_*"))
+        second = DatabaseDumper._compile_exclusions(("*_old", "_*"))
+        assert first is second
+
+
+class TestGetTablesToDump:
+    """Tests for _get_tables_to_dump method."""
 
     @pytest.fixture
     def dumper(self):
@@ -25,31 +63,61 @@ def dumper(self):
         mock_config.get_defaults.return_value = {}
         return DatabaseDumper(mock_config)
 
-    def test_compile_simple_pattern(self, dumper):
-        """Test compiling simple pattern."""
-        patterns = ["*_backup"]
-        compiled = dumper._compile_exclusion_patterns(patterns)
+    def test_all_tables_without_exclusions(self, dumper):
+        """Test "*" lists tables with SHOW TABLES."""
+        conn = mock.MagicMock()
+        conn.get_tables.return_value = ["users", "orders"]
 
-        assert len(compiled) == 1
-        assert isinstance(compiled[0], re.Pattern)
+        result = dumper._get_tables_to_dump(conn, {"name": "db", "tables": "*"})
 
-    def test_compiled_pattern_matches(self, dumper):
-        """Test compiled patterns match correctly."""
-        patterns = ["*_backup", "tmp_*"]
-        compiled = dumper._compile_exclusion_patterns(patterns)
+        assert result == [{"name": "users"}, {"name": "orders"}]
 
-        # Test matches
-        assert compiled[0].match("users_backup")
-        assert compiled[1].match("tmp_data")
+    def test_all_tables_with_exclusions(self, dumper, caplog):
+        """Test "*" with exclusions filters the listed tables and logs the count."""
+        conn = mock.MagicMock()
+        conn.get_tables.return_value = ["users", "tmp_a", "tmp_b"]
 
-        # Test non-matches
-        assert not compiled[0].match("users")
-        assert not compiled[1].match("data_tmp")
+        with caplog.at_level("INFO"):
+            result = dumper._get_tables_to_dump(
+                conn, {"name": "db", "tables": "*", "exclude_tables": ["tmp_*"]}
+            )
 
-    def test_empty_patterns(self, dumper):
-        """Test compiling empty pattern list."""
-        compiled = dumper._compile_exclusion_patterns([])
-        assert compiled == []
+        assert result == [{"name": "users"}]
+        assert "Excluded 2 table(s) matching exclusion patterns" in caplog.text
+
+    def test_explicit_list_without_exclusions(self, dumper):
+        """Test explicit lists are normalized to dicts when nothing is excluded."""
+        conn = mock.MagicMock()
+
+        result = dumper._get_tables_to_dump(
+            conn, {"name": "db", "tables": ["users", {"name": "orders", "row_limit": 5}]}
+        )
+
+        assert result == [{"name": "users"}, {"name": "orders", "row_limit": 5}]
+        conn.get_tables.assert_not_called()
+
+    def test_null_exclude_tables(self, dumper):
+        """Test an empty (null) exclude_tables key is treated as no exclusions."""
+        conn = mock.MagicMock()
+        conn.get_tables.return_value = ["users"]
+
+        result = dumper._get_tables_to_dump(
+            conn, {"name": "db", "tables": "*", "exclude_tables": None}
+        )
+
+        assert result == [{"name": "users"}]
+
+    def test_explicit_list_does_not_list_tables(self, dumper):
+        """Test explicit table lists never query the table list."""
+        conn = mock.MagicMock()
+
+        result = dumper._get_tables_to_dump(
+            conn,
+            {"name": "db", "tables": ["users", {"name": "tmp_x"}], "exclude_tables": ["tmp_*"]}
+        )
+
+        assert result == [{"name": "users"}]
+        conn.get_tables.assert_not_called()
 
 
 class TestIsTableExcluded:
@@ -108,7 +176,7 @@ def test_multiple_patterns(self, dumper):
     def test_with_compiled_patterns(self, dumper):
         """Test with pre-compiled patterns."""
         patterns = ["*_backup", "tmp_*"]
-        compiled = dumper._compile_exclusion_patterns(patterns)
+        compiled = dumper._compile_exclusions(tuple(patterns))
 
         assert dumper._is_table_excluded(
             "users_backup", patterns, compiled
@@ -124,6 +192,13 @@ def test_empty_patterns(self, dumper):
         """Test with no patterns."""
         assert dumper._is_table_excluded("any_table", []) is False
 
+    def test_debug_log_names_matching_pattern(self, dumper, caplog):
+        """Test the matching pattern is logged at debug level."""
+        with caplog.at_level(logging.DEBUG):
+            dumper._is_table_excluded("tmp_data", ["*_backup", "tmp_*"])
+
+        assert "excluded by pattern 'tmp_*'" in caplog.text
+
 
 class TestFilterDatabases:
     """Tests for _filter_databases method."""
@@ -213,6 +288,7 @@ def test_init(self):
         assert dumper.output_settings == {"directory": "./dumps"}
         assert dumper.defaults == {"row_limit": 1000}
         assert isinstance(dumper.stats, DumpStats)
+        assert dumper._dumper.output_settings == {"directory": "./dumps"}
 
     def test_stats_initialized_empty(self):
         """Test stats are initialized as empty."""
@@ -255,7 +331,7 @@ def test_run_creates_output_directory(self, mock_conn_class, mock_config):
         mock_conn.__enter__ = mock.MagicMock(return_value=mock_conn)
         mock_conn.__exit__ = mock.MagicMock(return_value=False)
         mock_conn.get_tables.return_value = []
-        mock_conn_class.return_value = mock_conn
+        mock_conn_class.from_pooled.return_value = mock_conn
 
         with tempfile.TemporaryDirectory() as tmpdir:
             output_dir = Path(tmpdir) / "new_dumps"
@@ -275,7 +351,7 @@ def test_run_returns_stats(self, mock_conn_class, mock_config):
         mock_conn.__enter__ = mock.MagicMock(return_value=mock_conn)
         mock_conn.__exit__ = mock.MagicMock(return_value=False)
         mock_conn.get_tables.return_value = []
-        mock_conn_class.return_value = mock_conn
+        mock_conn_class.from_pooled.return_value = mock_conn
 
         with tempfile.TemporaryDirectory() as tmpdir:
             mock_config.get_output_settings.return_value = {
@@ -304,3 +380,492 @@ def test_run_with_filters(self, mock_config):
 
             # Should return stats with empty databases
             assert result.databases == []
+
+
+class TestConcurrency:
+    """Tests for parallel database and table dumping."""
+
+    @pytest.fixture
+    def mock_config(self):
+        """Create a mock config with several databases."""
+        config = mock.MagicMock()
+        config.get_databases.return_value = [
+            {"name": f"db{i}", "instance": "primary", "tables": "*"}
+            for i in range(4)
+        ]
+        config.get_defaults.return_value = {}
+        config.get_instance.return_value = {
+            "host": "localhost",
+            "port": 3306,
+            "user": "root",
+            "password": "secret"
+        }
+        return config
+
+    def test_default_concurrency(self):
+        """Test concurrency defaults to sequential dumping."""
+        config = mock.MagicMock()
+        config.get_output_settings.return_value = {}
+        config.get_defaults.return_value = {}
+
+        dumper = DatabaseDumper(config)
+
+        assert dumper.concurrency == 1
+
+    @mock.patch('src.database_dumper.TableDumper')
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_parallel_run_collects_all_stats(self, mock_conn_class, mock_dumper_class, mock_config):
+        """Test parallel run records every database and table exactly once."""
+        mock_conn = mock.MagicMock()
+        mock_conn.__enter__ = mock.MagicMock(return_value=mock_conn)
+        mock_conn.__exit__ = mock.MagicMock(return_value=False)
+        mock_conn.get_tables.return_value = ["t1", "t2", "t3"]
+        mock_conn_class.from_pooled.return_value = mock_conn
+
+        mock_dumper_class.return_value.dump_table.side_effect = (
+            lambda conn, table, **kwargs: TableStats(table=table, rows_dumped=10, success=True)
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_config.get_output_settings.return_value = {
+                "directory": tmpdir,
+                "dump_concurrency": 4
+            }
+
+            dumper = DatabaseDumper(mock_config)
+            stats = dumper.run()
+
+        assert sorted(db.name for db in stats.databases) == ["db0", "db1", "db2", "db3"]
+        assert stats.total_tables == 12
+        assert stats.total_rows == 120
+        assert stats.errors == []
+        # Each database returns its pooled connection before tables are dumped
+        assert mock_conn.disconnect.call_count == 4
+        # Table workers keep one connection each and close them at the end
+        assert mock_conn_class.call_count <= 4
+        mock_conn_class.return_value.disconnect.assert_called()
+
+    @mock.patch('src.database_dumper.TableDumper')
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_worker_connection_error_recorded(
+        self, mock_conn_class, mock_dumper_class, mock_config
+    ):
+        """Test a failing worker connection is reported as a table error."""
+        main_conn = mock.MagicMock()
+        main_conn.__enter__ = mock.MagicMock(return_value=main_conn)
+        main_conn.__exit__ = mock.MagicMock(return_value=False)
+        main_conn.get_tables.return_value = ["t1", "t2"]
+        mock_conn_class.from_pooled.return_value = main_conn
+
+        mock_conn_class.return_value.connect.side_effect = Exception("Connection refused")
+        mock_config.get_databases.return_value = [
+            {"name": "db0", "instance": "primary", "tables": "*"}
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_config.get_output_settings.return_value = {
+                "directory": tmpdir,
+                "dump_concurrency": 2
+            }
+
+            dumper = DatabaseDumper(mock_config)
+            stats = dumper.run()
+
+        assert stats.total_tables == 2
+        assert len(stats.errors) == 2
+        assert all(err["error"] == "Connection refused" for err in stats.errors)
+
+    def test_current_log_settings(self):
+        """Test worker log settings mirror the root logger's level and log file."""
+        root = logging.getLogger()
+        old_level = root.level
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = str(Path(tmpdir) / "dump.log")
+            handler = logging.FileHandler(log_file)
+            root.addHandler(handler)
+            root.setLevel(logging.DEBUG)
+            try:
+                log_settings = DatabaseDumper._current_log_settings()
+            finally:
+                root.removeHandler(handler)
+                root.setLevel(old_level)
+                handler.close()
+
+        assert log_settings == {"level": "DEBUG", "file": log_file}
+
+    def test_unknown_executor_rejected(self):
+        """Test an unsupported dump_executor raises ValueError."""
+        config = mock.MagicMock()
+        config.get_output_settings.return_value = {"dump_executor": "fiber"}
+
+        with pytest.raises(ValueError, match="dump_executor"):
+            DatabaseDumper(config)
+
+    @staticmethod
+    def thread_pool(max_workers, mp_context, initializer, initargs):
+        """Stand-in for ProcessPoolExecutor that runs workers in threads."""
+        assert mp_context.get_start_method() == "spawn"
+        return ThreadPoolExecutor(
+            max_workers=max_workers, initializer=initializer, initargs=initargs
+        )
+
+    @mock.patch('src.database_dumper.setup_logging')
+    @mock.patch('src.database_dumper.ProcessPoolExecutor')
+    @mock.patch('src.database_dumper.TableDumper')
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_process_executor_dumps_tables_in_workers(
+        self, mock_conn_class, mock_dumper_class, mock_process_pool, mock_setup_logging,
+        mock_config
+    ):
+        """Test process mode dumps each table over its own worker connection."""
+        mock_process_pool.side_effect = self.thread_pool
+        main_conn = mock.MagicMock()
+        main_conn.__enter__ = mock.MagicMock(return_value=main_conn)
+        main_conn.__exit__ = mock.MagicMock(return_value=False)
+        main_conn.get_tables.return_value = ["t1", "t2", "t3"]
+        main_conn.get_all_columns.return_value = {}
+        mock_conn_class.from_pooled.return_value = main_conn
+        worker_conn = mock_conn_class.return_value
+        worker_conn.__enter__.return_value = worker_conn
+
+        mock_dumper_class.return_value.dump_table.side_effect = (
+            lambda conn, table, **kwargs: TableStats(table=table, rows_dumped=5, success=True)
+        )
+        mock_config.get_databases.return_value = [
+            {"name": "db0", "instance": "primary", "tables": "*"},
+            {"name": "db1", "instance": "primary", "tables": "*"}
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_config.get_output_settings.return_value = {
+                "directory": tmpdir,
+                "dump_concurrency": 2,
+                "dump_executor": "process",
+                "timestamp_suffix": False
+            }
+
+            dumper = DatabaseDumper(mock_config)
+            stats = dumper.run()
+
+        # One set of worker processes serves every database of the run
+        mock_process_pool.assert_called_once()
+        # Workers configure logging like the parent process
+        mock_setup_logging.assert_called_with(DatabaseDumper._current_log_settings())
+        assert dumper._process_pool is None
+        assert stats.total_tables == 6
+        assert stats.total_rows == 30
+        for db_stats in stats.databases:
+            assert [t.table for t in db_stats.tables] == ["t1", "t2", "t3"]
+        assert mock_conn_class.call_count == 6
+        databases = sorted(c.kwargs["database"] for c in mock_conn_class.call_args_list)
+        assert databases == ["db0"] * 3 + ["db1"] * 3
+        calls = mock_dumper_class.return_value.dump_table.call_args_list
+        assert all(c.args[0] is worker_conn for c in calls)
+        assert sorted(c.kwargs["output_path"] for c in calls) == [
+            str(Path(tmpdir) / db / f"{t}.sql") for db in ("db0", "db1") for t in ("t1", "t2", "t3")
+        ]
+
+
+class TestSingleFileParallel:
+    """Tests for parallel dumping into one file per database."""
+
+    @staticmethod
+    def make_connection(*args, **kwargs):
+        """Create a mock connection whose tables hold one row each."""
+        conn = mock.MagicMock()
+        conn.__enter__ = mock.MagicMock(return_value=conn)
+        conn.__exit__ = mock.MagicMock(return_value=False)
+        conn.get_tables.return_value = ["a", "b", "c"]
+        conn.get_all_columns.return_value = {
+            t: [ColumnInfo("id", "int", "NO", "PRI", None, "")] for t in ("a", "b", "c")
+        }
+        conn.get_create_table.side_effect = lambda table: f"CREATE TABLE `{table}` (`id` int)"
+        conn.get_cursor.side_effect = lambda **kwargs: mock.MagicMock(
+            **{"fetchmany.side_effect": [[(1,)], []]}
+        )
+        return conn
+
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_parts_merged_in_table_order(self, mock_conn_class):
+        """Test tables dumped in parallel land in one file in table order."""
+        mock_conn_class.from_pooled.side_effect = self.make_connection
+        mock_conn_class.side_effect = self.make_connection
+        config = mock.MagicMock()
+        config.get_databases.return_value = [{"name": "db0", "instance": "primary", "tables": "*"}]
+        config.get_defaults.return_value = {}
+        config.get_instance.return_value = {
+            "host": "localhost", "user": "root", "password": "secret"
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.get_output_settings.return_value = {
+                "directory": tmpdir,
+                "dump_concurrency": 3,
+                "separate_files": False,
+                "timestamp_suffix": False,
+                "compress": True
+            }
+            stats = DatabaseDumper(config).run()
+
+            assert sorted(os.listdir(tmpdir)) == ["db0.sql.gz"]
+            with gzip.open(Path(tmpdir) / "db0.sql.gz", 'rt') as f:
+                content = f.read()
+
+        assert stats.total_rows == 3
+        assert all(t.file_path.endswith("db0.sql.gz") for t in stats.databases[0].tables)
+        positions = [content.index(f"-- Table: {t}\n") for t in ("a", "b", "c")]
+        assert positions == sorted(positions)
+
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_failed_first_table_reports_compressed_path(self, mock_conn_class):
+        """Test a failing first table still reports the merged file's real path."""
+        def make_connection(*args, **kwargs):
+            conn = self.make_connection()
+
+            def get_create_table(table):
+                if table == "a":
+                    raise RuntimeError("boom")
+                return f"CREATE TABLE `{table}` (`id` int)"
+
+            conn.get_create_table.side_effect = get_create_table
+            return conn
+
+        mock_conn_class.from_pooled.side_effect = make_connection
+        mock_conn_class.side_effect = make_connection
+        config = mock.MagicMock()
+        config.get_databases.return_value = [{"name": "db0", "instance": "primary", "tables": "*"}]
+        config.get_defaults.return_value = {}
+        config.get_instance.return_value = {
+            "host": "localhost", "user": "root", "password": "secret"
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.get_output_settings.return_value = {
+                "directory": tmpdir,
+                "dump_concurrency": 3,
+                "separate_files": False,
+                "timestamp_suffix": False,
+                "compress": True
+            }
+            stats = DatabaseDumper(config).run()
+
+            assert sorted(os.listdir(tmpdir)) == ["db0.sql.gz"]
+
+        tables = stats.databases[0].tables
+        assert [t.success for t in tables] == [False, True, True]
+        assert all(t.file_path.endswith("db0.sql.gz") for t in tables)
+
+    def test_concatenate_falls_back_without_sendfile(self):
+        """Test part files are copied when os.sendfile fails."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parts = []
+            for i, data in enumerate([b"first\n", b"second\n"]):
+                part = Path(tmpdir) / f"out.sql.{i}.part"
+                part.write_bytes(data)
+                parts.append(str(part))
+
+            with mock.patch('src.database_dumper.os.sendfile', side_effect=OSError, create=True):
+                DatabaseDumper._concatenate_files(str(Path(tmpdir) / "out.sql"), parts)
+
+            assert (Path(tmpdir) / "out.sql").read_bytes() == b"first\nsecond\n"
+            assert not any(os.path.exists(p) for p in parts)
+
+
+class TestConnectionPooling:
+    """Tests for instance-keyed connection pooling."""
+
+    @pytest.fixture
+    def mock_config(self):
+        """Create a mock config with two databases on one instance."""
+        config = mock.MagicMock()
+        config.get_databases.return_value = [
+            {"name": "db1", "instance": "primary", "tables": "*"},
+            {"name": "db2", "instance": "primary", "tables": "*"},
+        ]
+        config.get_defaults.return_value = {}
+        config.get_instance.return_value = {
+            "host": "localhost",
+            "port": 3306,
+            "user": "root",
+            "password": "secret"
+        }
+        return config
+
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_pool_shared_per_instance(self, mock_conn_class, mock_config):
+        """Test databases on the same instance share one pool."""
+        mock_conn = mock.MagicMock()
+        mock_conn.__enter__ = mock.MagicMock(return_value=mock_conn)
+        mock_conn.__exit__ = mock.MagicMock(return_value=False)
+        mock_conn.get_tables.return_value = []
+        mock_conn_class.from_pooled.return_value = mock_conn
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_config.get_output_settings.return_value = {"directory": tmpdir}
+            dumper = DatabaseDumper(mock_config)
+            dumper.run()
+
+        mock_conn_class.create_pool.assert_called_once()
+        pool = mock_conn_class.create_pool.return_value
+        assert pool.get_connection.call_count == 2
+        pooled = pool.get_connection.return_value
+        pooled.cmd_init_db.assert_has_calls([mock.call("db1"), mock.call("db2")])
+        mock_conn_class.close_pool.assert_called_once_with(pool)
+        assert dumper._pools == {}
+
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_pool_exhausted_falls_back(self, mock_conn_class, mock_config):
+        """Test a dedicated connection is opened when the pool is exhausted."""
+        mock_conn_class.create_pool.return_value.get_connection.side_effect = PoolError("exhausted")
+        mock_config.get_output_settings.return_value = {}
+
+        dumper = DatabaseDumper(mock_config)
+        conn = dumper._connect({"name": "db1", "instance": "primary"})
+
+        assert conn is mock_conn_class.return_value
+        mock_conn_class.assert_called_once_with(
+            host="localhost",
+            port=3306,
+            user="root",
+            password="secret",
+            database="db1",
+            compress=False,
+            net_write_timeout=mock_conn_class.DEFAULT_NET_WRITE_TIMEOUT
+        )
+
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_pool_sized_to_concurrency(self, mock_conn_class, mock_config):
+        """Test the pool holds dump_concurrency connections."""
+        mock_config.get_output_settings.return_value = {"dump_concurrency": 4}
+
+        DatabaseDumper(mock_config)._get_pool("primary")
+
+        assert mock_conn_class.create_pool.call_args.kwargs["pool_size"] == 4
+
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_pool_capped_at_instance_databases(self, mock_conn_class, mock_config):
+        """Test the pool holds no more connections than the run has databases."""
+        mock_conn = mock.MagicMock()
+        mock_conn.__enter__ = mock.MagicMock(return_value=mock_conn)
+        mock_conn.__exit__ = mock.MagicMock(return_value=False)
+        mock_conn.get_tables.return_value = []
+        mock_conn_class.from_pooled.return_value = mock_conn
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_config.get_output_settings.return_value = {
+                "directory": tmpdir,
+                "dump_concurrency": 8
+            }
+            DatabaseDumper(mock_config).run()
+
+        assert mock_conn_class.create_pool.call_args.kwargs["pool_size"] == 2
+
+    @mock.patch('src.database_dumper.DatabaseConnection')
+    def test_pool_uses_instance_session_options(self, mock_conn_class, mock_config):
+        """Test instance compress reaches the pool and net_write_timeout each checkout."""
+        mock_config.get_instance.return_value = {
+            "host": "localhost",
+            "user": "root",
+            "password": "secret",
+            "compress": True,
+            "net_write_timeout": 600
+        }
+        mock_config.get_output_settings.return_value = {}
+
+        DatabaseDumper(mock_config)._connect({"name": "db1", "instance": "primary"})
+
+        assert mock_conn_class.create_pool.call_args.kwargs["compress"] is True
+        assert mock_conn_class.from_pooled.call_args.kwargs["net_write_timeout"] == 600
+
+
+class TestDumpSingleTable:
+    """Tests for _dump_single_table method."""
+
+    @pytest.fixture
+    def dumper(self):
+        """Create a DatabaseDumper with mocked config."""
+        mock_config = mock.MagicMock()
+        mock_config.get_output_settings.return_value = {}
+        mock_config.get_defaults.return_value = {"row_limit": 10}
+        return DatabaseDumper(mock_config)
+
+    def test_separate_file_path(self, dumper):
+        """Test each table gets its own file when no single file is given."""
+        table_dumper = mock.MagicMock()
+        dumper._dumper = table_dumper
+
+        dumper._dump_single_table(
+            mock.MagicMock(), {"name": "users"}, {"name": "db"}, "/out/db/",
+            OutputFormat.CSV, None, is_first=False
+        )
+
+        kwargs = table_dumper.dump_table.call_args.kwargs
+        assert kwargs["output_path"] == "/out/db/users.csv"
+        assert kwargs["append"] is False
+        assert kwargs["settings"].row_limit == 10
+
+    def test_single_file_appends_after_first(self, dumper):
+        """Test tables after the first append to the shared file."""
+        table_dumper = mock.MagicMock()
+        dumper._dumper = table_dumper
+        single_file = Path("/out/db.sql")
+
+        for is_first in (True, False):
+            dumper._dump_single_table(
+                mock.MagicMock(), {"name": "users"}, {"name": "db"}, "/out/",
+                OutputFormat.SQL, single_file, is_first=is_first
+            )
+
+        first, second = table_dumper.dump_table.call_args_list
+        assert first.kwargs["output_path"] == single_file
+        assert first.kwargs["append"] is False
+        assert second.kwargs["output_path"] == single_file
+        assert second.kwargs["append"] is True
+
+
+class TestLogTableResult:
+    """Tests for batched table result logging."""
+
+    @pytest.fixture
+    def dumper(self):
+        """Create a DatabaseDumper with mocked config."""
+        mock_config = mock.MagicMock()
+        mock_config.get_output_settings.return_value = {}
+        mock_config.get_defaults.return_value = {}
+        return DatabaseDumper(mock_config)
+
+    def test_successes_buffered_until_flush(self, dumper, caplog):
+        """Test successful tables are logged together on flush."""
+        succeeded = []
+        with caplog.at_level(logging.INFO):
+            dumper._log_table_result(TableStats("users", 5, success=True), "db", succeeded)
+            dumper._log_table_result(TableStats("orders", 7, success=True), "db", succeeded)
+            dumper._log_table_result(
+                TableStats("items", 9, success=True, rows_approximate=True), "db", succeeded
+            )
+            assert caplog.records == []
+
+            dumper._flush_success_log(succeeded, "db")
+
+        assert len(caplog.records) == 1
+        assert "users (5 rows), orders (7 rows), items (~9 rows)" in caplog.records[0].getMessage()
+        assert succeeded == []
+
+    def test_flush_at_batch_size(self, dumper, caplog):
+        """Test a summary line is emitted once the batch fills up."""
+        succeeded = []
+        with caplog.at_level(logging.INFO):
+            for i in range(DatabaseDumper.SUCCESS_LOG_BATCH):
+                dumper._log_table_result(TableStats(f"t{i}", success=True), "db", succeeded)
+
+        assert len(caplog.records) == 1
+        assert succeeded == []
+
+    def test_errors_logged_immediately(self, dumper, caplog):
+        """Test failures are logged and recorded without buffering."""
+        succeeded = []
+        with caplog.at_level(logging.INFO):
+            dumper._log_table_result(TableStats("users", error="boom"), "db", succeeded)
+
+        assert "users: boom" in caplog.text
+        assert dumper.stats.errors == [{"database": "db", "table": "users", "error": "boom"}]
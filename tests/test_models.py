@@ -2,6 +2,8 @@
 Unit tests for models.py
 """
 
+import pickle
+
 import pytest
 from src.models import (
     OutputFormat,
@@ -104,6 +106,14 @@ def test_failed_dump(self):
         assert stats.success is False
         assert stats.error == "Connection timeout"
 
+    def test_slots_and_pickling(self):
+        """Test stats use slots and survive pickling to worker processes."""
+        stats = TableStats(table="orders", rows_dumped=3, success=True)
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.unknown = 1
+        assert pickle.loads(pickle.dumps(stats)) == stats
+
 
 class TestDatabaseStats:
     """Tests for DatabaseStats dataclass."""
@@ -239,3 +249,10 @@ def test_from_configs_table_order_direction_overrides(self):
         settings = DumpSettings.from_configs(defaults, db_config, table_config)
         assert settings.order_direction == "DESC"  # table wins
         assert settings.order_by == "id"  # from db_config
+
+    def test_from_configs_explicit_null_overrides(self):
+        """Test an explicit null at table level clears an inherited value."""
+        defaults = {"row_limit": 500}
+        table_config = {"name": "events", "row_limit": None}
+        settings = DumpSettings.from_configs(defaults, {}, table_config)
+        assert settings.row_limit is None
@@ -3,15 +3,28 @@
 """
 
 import gzip
+import io
+import shutil
 import tempfile
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
 from src.models import ColumnInfo, DumpSettings, OutputFormat, TableStats
-from src.table_dumper import TableDumper
+from src.table_dumper import TableDumper, _PigzWriter
+
+PIGZ_STANDIN = """#!/bin/sh
+for arg do
+    shift
+    if [ -n "$skip" ]; then skip=; continue; fi
+    if [ "$arg" = -p ]; then skip=1; continue; fi
+    set -- "$@" "$arg"
+done
+exec gzip "$@"
+"""
 
 
 class TestTableDumper:
@@ -39,16 +52,15 @@ def output_settings(self):
             "batch_size": 1000
         }
 
-    def test_init(self, mock_connection, output_settings):
+    def test_init(self, output_settings):
         """Test TableDumper initialization."""
-        dumper = TableDumper(mock_connection, output_settings)
-        assert dumper.connection == mock_connection
+        dumper = TableDumper(output_settings)
         assert dumper.output_settings == output_settings
         assert dumper.batch_size == 1000
 
-    def test_init_default_batch_size(self, mock_connection):
+    def test_init_default_batch_size(self):
         """Test default batch size when not specified."""
-        dumper = TableDumper(mock_connection, {})
+        dumper = TableDumper({})
         assert dumper.batch_size == TableDumper.DEFAULT_BATCH_SIZE
 
 
@@ -58,8 +70,7 @@ class TestBuildSelectQuery:
     @pytest.fixture
     def dumper(self):
         """Create a TableDumper instance."""
-        mock_conn = mock.MagicMock()
-        return TableDumper(mock_conn, {})
+        return TableDumper({})
 
     def test_basic_query(self, dumper):
         """Test basic SELECT query."""
@@ -144,8 +155,7 @@ class TestTypeFormatters:
     @pytest.fixture
     def dumper(self):
         """Create a TableDumper instance."""
-        mock_conn = mock.MagicMock()
-        return TableDumper(mock_conn, {})
+        return TableDumper({})
 
     def test_format_none(self, dumper):
         """Test NULL formatting."""
@@ -183,6 +193,180 @@ def test_format_datetime(self, dumper):
         result = dumper._type_formatters[datetime](dt)
         assert result == "'2024-01-15 10:30:45'"
 
+    def test_format_datetime_fractional_seconds(self, dumper):
+        """Test DATETIME(6) values keep their microseconds."""
+        dt = datetime(2024, 1, 15, 10, 30, 45, 120000)
+        assert dumper._format_sql_value(dt) == "'2024-01-15 10:30:45.120000'"
+
+    def test_format_string_escaping(self, dumper):
+        """Test strings are escaped and quoted."""
+        result = dumper._format_sql_value("it's a\\path\nline")
+        assert result == "'it\\'s a\\\\path\\nline'"
+
+    def test_format_string_control_characters(self, dumper):
+        """Test NUL and Ctrl-Z are escaped as MySQL expects."""
+        assert dumper._format_sql_value("a\x00b\x1ac\r") == "'a\\0b\\Zc\\r'"
+
+    def test_format_bytearray(self, dumper):
+        """Test bytearray formatting as hex."""
+        assert dumper._format_sql_value(bytearray(b'\x01\x02')) == "X'0102'"
+
+    def test_format_decimal(self, dumper):
+        """Test Decimal values are written as exact unquoted numbers."""
+        assert dumper._format_sql_value(Decimal("10.50")) == "10.50"
+        assert dumper._format_sql_value(Decimal("0E-10")) == "0.0000000000"
+
+    def test_format_date_and_time(self, dumper):
+        """Test DATE and TIME values use ISO format."""
+        assert dumper._format_sql_value(date(2024, 1, 15)) == "'2024-01-15'"
+        assert dumper._format_sql_value(time(10, 30, 45)) == "'10:30:45'"
+
+    def test_formatters_shared_between_instances(self, dumper):
+        """Test the formatter table is built once, not per instance."""
+        assert dumper._type_formatters is TableDumper({})._type_formatters
+
+    def test_format_timedelta(self, dumper):
+        """Test TIME values (returned as timedelta) use MySQL TIME syntax."""
+        assert dumper._format_sql_value(timedelta(hours=-1, seconds=5)) == "'-00:59:55'"
+        assert dumper._format_sql_value(timedelta(hours=26, minutes=3)) == "'26:03:00'"
+
+    def test_format_unconvertible_type(self, dumper):
+        """Test types without a MySQL conversion fall back to their string form."""
+        assert dumper._format_sql_value({"a"}) == "'{\\'a\\'}'"
+
+
+class TestWriteInsertBatch:
+    """Tests for _write_insert_batch method."""
+
+    def test_batch_written_once(self):
+        """Test a whole INSERT batch is emitted with a single write."""
+        dumper = TableDumper({})
+        handle = mock.MagicMock()
+
+        prefix = b"INSERT INTO `users` (`id`, `name`) VALUES\n"
+
+        dumper._write_insert_batch(handle, prefix, [(1, "a"), (2, None)])
+
+        handle.write.assert_called_once_with(
+            b"INSERT INTO `users` (`id`, `name`) VALUES\n"
+            b"  (1, 'a'),\n"
+            b"  (2, NULL);\n\n"
+        )
+
+    def test_column_formatters(self):
+        """Test formatters are chosen from declared column types."""
+        dumper = TableDumper({})
+        columns = [
+            ColumnInfo("id", "bigint(20) unsigned", "NO", "PRI", None, ""),
+            ColumnInfo("name", "VARCHAR(255)", "YES", "", None, ""),
+            ColumnInfo("data", "longblob", "YES", "", None, ""),
+            ColumnInfo("doc", "json", "YES", "", None, ""),
+        ]
+
+        formatters = dumper._column_formatters(columns)
+
+        assert formatters[3] == dumper._format_sql_value
+        assert [fmt(v) for fmt, v in zip(formatters, (7, "it's", b"\x01", [1]))] == [
+            "7", "'it\\'s'", "X'01'", "'[1]'"
+        ]
+
+    def test_column_formatters_unexpected_value_type(self):
+        """Test values of another type than the column's fall back to dispatch."""
+        dumper = TableDumper({})
+        formatters = dumper._column_formatters([
+            ColumnInfo("name", "varchar(20)", "YES", "", None, ""),
+            ColumnInfo("id", "int", "NO", "PRI", None, ""),
+        ])
+
+        # mysql-connector 8.0 returns bytearray for binary-collation text
+        assert formatters[0](bytearray(b"ab")) == "X'6162'"
+        assert formatters[1](True) == "1"
+
+    def test_column_formatters_numeric_and_temporal(self):
+        """Test DECIMAL, FLOAT and temporal columns format without dispatch."""
+        dumper = TableDumper({})
+        formatters = dumper._column_formatters([
+            ColumnInfo("price", "decimal(10,2)", "YES", "", None, ""),
+            ColumnInfo("ratio", "double", "YES", "", None, ""),
+            ColumnInfo("day", "date", "YES", "", None, ""),
+            ColumnInfo("created", "timestamp(6)", "YES", "", None, ""),
+        ])
+        values = (Decimal("0E-10"), 0.5, date(2024, 1, 15), datetime(2024, 1, 15, 10, 30))
+
+        assert all(fmt != dumper._format_sql_value for fmt in formatters)
+        assert [fmt(v) for fmt, v in zip(formatters, values)] == [
+            "0.0000000000", "0.5", "'2024-01-15'", "'2024-01-15 10:30:00'"
+        ]
+
+    def test_column_formatters_numeric_and_temporal_fallback(self):
+        """Test DECIMAL, FLOAT and temporal columns dispatch values of another type."""
+        dumper = TableDumper({})
+        formatters = dumper._column_formatters([
+            ColumnInfo("price", "decimal(10,2)", "YES", "", None, ""),
+            ColumnInfo("ratio", "double", "YES", "", None, ""),
+            ColumnInfo("day", "date", "YES", "", None, ""),
+            ColumnInfo("created", "datetime", "YES", "", None, ""),
+        ])
+        values = ("1.50", Decimal("0.5"), datetime(2024, 1, 15, 10, 30), "0000-00-00 00:00:00")
+
+        assert [fmt(v) for fmt, v in zip(formatters, values)] == [
+            "'1.50'", "0.5", "'2024-01-15 10:30:00'", "'0000-00-00 00:00:00'"
+        ]
+
+    def test_batch_with_column_formatters(self):
+        """Test per-column formatters are applied and NULLs still written."""
+        dumper = TableDumper({})
+        handle = mock.MagicMock()
+        formatters = dumper._column_formatters([
+            ColumnInfo("id", "int", "NO", "PRI", None, ""),
+            ColumnInfo("price", "decimal(10,2)", "YES", "", None, ""),
+        ])
+
+        dumper._write_insert_batch(handle, b"", [(1, Decimal("1.50")), (2, None)], formatters)
+
+        handle.write.assert_called_once_with(b"  (1, 1.50),\n  (2, NULL);\n\n")
+
+
+class TestSizedInserts:
+    """Tests for INSERT statements packed by size."""
+
+    def test_rows_packed_across_batches(self):
+        """Test rows from several fetches share a statement until the limit."""
+        dumper = TableDumper({})
+        handle = io.BytesIO()
+        prefix = b"INSERT INTO `t` VALUES\n"
+
+        rows = dumper._write_sized_inserts(
+            handle, prefix, [[(1,), (2,)], [(3,)], [(4,)]], [str], len(prefix) + 3 + 20
+        )
+
+        assert rows == 4
+        assert handle.getvalue() == (
+            b"INSERT INTO `t` VALUES\n  (1),\n  (2),\n  (3);\n\n"
+            b"INSERT INTO `t` VALUES\n  (4);\n\n"
+        )
+
+    def test_oversized_row_written_alone(self):
+        """Test a row larger than the limit still gets written."""
+        dumper = TableDumper({})
+        handle = io.BytesIO()
+
+        dumper._write_sized_inserts(handle, b"I\n", [[("x" * 50,), ("y",)]], None, 10)
+
+        assert handle.getvalue() == b"I\n  ('" + b"x" * 50 + b"');\n\nI\n  ('y');\n\n"
+
+    def test_limit_capped_by_max_allowed_packet(self):
+        """Test statements never exceed the server's max_allowed_packet."""
+        dumper = TableDumper({"insert_max_bytes": 16 * 1024 * 1024})
+        connection = mock.MagicMock()
+        connection.get_create_table.return_value = "CREATE TABLE `t` (`id` int)"
+        connection.get_max_allowed_packet.return_value = 60
+
+        with mock.patch.object(dumper, '_write_sized_inserts', return_value=0) as sized:
+            dumper._dump_as_sql(connection, io.BytesIO(), "t", ["id"], [])
+
+        assert sized.call_args.args[-1] == 60
+
 
 class TestOpenOutputFile:
     """Tests for _open_output_file method."""
@@ -190,14 +374,12 @@ class TestOpenOutputFile:
     @pytest.fixture
     def dumper_no_compress(self):
         """Create a TableDumper without compression."""
-        mock_conn = mock.MagicMock()
-        return TableDumper(mock_conn, {"compress": False})
+        return TableDumper({"compress": False})
 
     @pytest.fixture
     def dumper_with_compress(self):
         """Create a TableDumper with compression."""
-        mock_conn = mock.MagicMock()
-        return TableDumper(mock_conn, {"compress": True})
+        return TableDumper({"compress": True})
 
     def test_open_without_compression(self, dumper_no_compress):
         """Test opening file without compression."""
@@ -211,6 +393,16 @@ def test_open_without_compression(self, dumper_no_compress):
             assert result_path == output_path
             assert not str(result_path).endswith('.gz')
 
+    def test_small_writes_coalesced(self, dumper_no_compress):
+        """Test small writes stay buffered until the write buffer fills."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.sql"
+            _, handle = dumper_no_compress._open_output_file(output_path, append=False)
+            handle.write(b"x" * 100_000)
+            assert output_path.stat().st_size == 0
+            handle.close()
+            assert output_path.stat().st_size == 100_000
+
     def test_open_with_compression(self, dumper_with_compress):
         """Test opening file with compression."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -223,6 +415,192 @@ def test_open_with_compression(self, dumper_with_compress):
             assert str(result_path).endswith('.gz')
             assert result_path == Path(str(output_path) + '.gz')
 
+    def test_compress_level_setting(self):
+        """Test the configured gzip compression level is used."""
+        dumper = TableDumper({"compress": True, "compress_level": 6})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch('src.table_dumper.gzip.open', wraps=gzip.open) as mock_open:
+                _, handle = dumper._open_output_file(Path(tmpdir) / "test.sql", append=False)
+                handle.close()
+
+        assert mock_open.call_args.kwargs['compresslevel'] == 6
+
+    def test_compress_defaults(self, dumper_with_compress):
+        """Test compressed output uses a fast level and a large write buffer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch('src.table_dumper.gzip.open', wraps=gzip.open) as mock_open:
+                _, handle = dumper_with_compress._open_output_file(
+                    Path(tmpdir) / "test.sql", append=False
+                )
+                handle.write(b"data")
+                handle.close()
+
+            assert mock_open.call_args.kwargs['compresslevel'] == TableDumper.DEFAULT_COMPRESS_LEVEL
+            with gzip.open(Path(tmpdir) / "test.sql.gz", 'rb') as f:
+                assert f.read() == b"data"
+
+    def test_compress_gzip_name(self):
+        """Test compress: gzip behaves like compress: true."""
+        assert TableDumper({"compress": "gzip"}).compression == "gzip"
+        assert TableDumper({"compress": True}).compression == "gzip"
+        assert TableDumper({"compress": False}).compression is None
+
+    def test_unsupported_compression(self):
+        """Test unknown codecs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            TableDumper({"compress": "lz4"})
+
+    def test_zstd_requires_package(self):
+        """Test a clear error when zstandard is not installed."""
+        with mock.patch('src.table_dumper.zstandard', None):
+            with pytest.raises(ValueError, match="zstandard"):
+                TableDumper({"compress": "zstd"})
+
+    def test_zstd_threads_split_across_concurrency(self):
+        """Test zstd threads per stream shrink as more tables are dumped at once."""
+        with mock.patch('src.table_dumper.zstandard'):
+            with mock.patch('src.table_dumper.os.cpu_count', return_value=8):
+                assert TableDumper({"compress": "zstd"}).zstd_threads == 8
+                assert TableDumper({"compress": "zstd", "dump_concurrency": 4}).zstd_threads == 2
+                assert TableDumper({"compress": "zstd", "dump_concurrency": 8}).zstd_threads == 0
+                assert TableDumper(
+                    {"compress": "zstd", "dump_concurrency": 8, "compress_threads": 3}
+                ).zstd_threads == 3
+
+    def test_pigz_threads_split_across_concurrency(self):
+        """Test pigz gets a share of the cores rather than all of them."""
+        with mock.patch('src.table_dumper.shutil.which', return_value='/usr/bin/pigz'), \
+                mock.patch('src.table_dumper.os.cpu_count', return_value=8), \
+                mock.patch('src.table_dumper._PigzWriter') as mock_writer:
+            mock_writer.side_effect = lambda *args: io.BytesIO()
+            with tempfile.TemporaryDirectory() as tmpdir:
+                for settings, threads in (
+                    ({}, '8'),
+                    ({"dump_concurrency": 4}, '2'),
+                    ({"dump_concurrency": 16}, '1'),
+                    ({"dump_concurrency": 4, "compress_threads": 3}, '3'),
+                ):
+                    dumper = TableDumper({"compress": "pigz", **settings})
+                    dumper._open_output_file(Path(tmpdir) / "t.sql", False)
+                    command = mock_writer.call_args.args[0]
+                    assert command[command.index('-p') + 1] == threads
+
+    def test_compress_threads_must_be_positive(self):
+        """Test compress_threads below 1 is rejected instead of silently ignored."""
+        for threads in (0, -1):
+            with pytest.raises(ValueError, match="compress_threads must be at least 1"):
+                TableDumper({"compress": "gzip", "compress_threads": threads})
+
+    def test_open_zstd(self):
+        """Test zstd output gets a .zst suffix and appended frames decode together."""
+        zstandard = pytest.importorskip("zstandard")
+        dumper = TableDumper({"compress": "zstd"})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.sql"
+            for append, data in ((False, b"first "), (True, b"second")):
+                result_path, handle = dumper._open_output_file(output_path, append=append)
+                handle.write(data)
+                handle.close()
+
+            assert result_path == Path(str(output_path) + '.zst')
+            with open(result_path, 'rb') as f:
+                reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+                assert reader.read() == b"first second"
+
+    def test_igzip_requires_package(self):
+        """Test a clear error when isal is not installed."""
+        with mock.patch('src.table_dumper.igzip', None):
+            with pytest.raises(ValueError, match="isal"):
+                TableDumper({"compress": "igzip"})
+
+    def test_open_igzip(self):
+        """Test igzip output is a standard .gz file."""
+        pytest.importorskip("isal")
+        dumper = TableDumper({"compress": "igzip"})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.sql"
+            for append, data in ((False, b"first "), (True, b"second")):
+                result_path, handle = dumper._open_output_file(output_path, append=append)
+                handle.write(data)
+                handle.close()
+
+            assert result_path == Path(str(output_path) + '.gz')
+            with gzip.open(result_path, 'rb') as f:
+                assert f.read() == b"first second"
+
+    def test_pigz_requires_binary(self):
+        """Test a clear error when pigz is not on PATH."""
+        with mock.patch('src.table_dumper.shutil.which', return_value=None):
+            with pytest.raises(ValueError, match="pigz"):
+                TableDumper({"compress": "pigz"})
+
+    def test_open_pigz(self):
+        """Test pigz output is a standard .gz file and appends a new member."""
+        pigz_path = shutil.which("pigz")
+        if pigz_path is None and shutil.which("gzip") is None:
+            pytest.skip("neither pigz nor gzip is installed")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            if pigz_path is None:
+                # gzip accepts the same -c/-N flags, so it stands in once -p is dropped
+                pigz_path = Path(tmpdir) / "pigz"
+                pigz_path.write_text(PIGZ_STANDIN)
+                pigz_path.chmod(0o755)
+            with mock.patch('src.table_dumper.shutil.which', return_value=str(pigz_path)):
+                dumper = TableDumper({"compress": "pigz"})
+
+            output_path = Path(tmpdir) / "test.sql"
+            for append, data in ((False, b"first "), (True, b"second")):
+                result_path, handle = dumper._open_output_file(output_path, append=append)
+                handle.write(data)
+                handle.close()
+
+            assert result_path == Path(str(output_path) + '.gz')
+            with gzip.open(result_path, 'rb') as f:
+                assert f.read() == b"first second"
+
+    def test_pigz_start_failure(self):
+        """Test a failed pigz start raises its own error, also on cleanup."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            writer = _PigzWriter.__new__(_PigzWriter)
+            popen_error = FileNotFoundError("pigz")
+            with mock.patch('src.table_dumper.subprocess.Popen', side_effect=popen_error):
+                with pytest.raises(FileNotFoundError):
+                    writer.__init__(["pigz", "-c"], Path(tmpdir) / "test.sql.gz", "wb")
+
+            # The finalizer runs close() on the half-built writer
+            writer.close()
+            assert writer.closed
+
+    def test_pigz_close_reaps_dead_process(self):
+        """Test a broken pipe on close still waits for pigz and reports its status."""
+        process = mock.MagicMock()
+        process.stdin.close.side_effect = BrokenPipeError()
+        process.wait.return_value = 1
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch('src.table_dumper.subprocess.Popen', return_value=process):
+                writer = _PigzWriter(["pigz", "-c"], Path(tmpdir) / "test.sql.gz", "wb")
+            with pytest.raises(OSError, match="status 1"):
+                writer.close()
+
+        process.wait.assert_called_once()
+        assert writer.closed
+
+    def test_open_compressed_str_path(self, dumper_with_compress):
+        """Test string paths stay strings when compression adds .gz."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = f"{tmpdir}/test.sql"
+            result_path, handle = dumper_with_compress._open_output_file(
+                output_path, append=False
+            )
+            handle.close()
+
+            assert result_path == output_path + '.gz'
+
     def test_open_append_mode(self, dumper_no_compress):
         """Test opening file in append mode."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -232,14 +610,14 @@ def test_open_append_mode(self, dumper_no_compress):
             result_path, handle = dumper_no_compress._open_output_file(
                 output_path, append=False
             )
-            handle.write("initial")
+            handle.write(b"initial")
             handle.close()
 
             # Append more content
             result_path, handle = dumper_no_compress._open_output_file(
                 output_path, append=True
             )
-            handle.write("appended")
+            handle.write(b"appended")
             handle.close()
 
             # Verify content
@@ -266,14 +644,14 @@ def test_dump_table_error_handling(self, mock_connection):
         """Test error handling during dump."""
         mock_connection.get_table_columns.side_effect = Exception("Connection lost")
 
-        dumper = TableDumper(mock_connection, {"compress": False})
+        dumper = TableDumper({"compress": False})
 
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "test.sql"
             settings = DumpSettings()
 
             stats = dumper.dump_table(
-                "users", output_path, settings, OutputFormat.SQL
+                mock_connection, "users", output_path, settings, OutputFormat.SQL
             )
 
             assert stats.success is False
@@ -282,18 +660,421 @@ def test_dump_table_error_handling(self, mock_connection):
     def test_dump_table_returns_stats(self, mock_connection):
         """Test that dump_table returns TableStats."""
         mock_cursor = mock.MagicMock()
-        mock_cursor.__iter__ = mock.MagicMock(return_value=iter([]))
+        mock_cursor.fetchmany.return_value = []
         mock_connection.get_cursor.return_value = mock_cursor
 
-        dumper = TableDumper(mock_connection, {"compress": False})
+        dumper = TableDumper({"compress": False})
 
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "test.sql"
             settings = DumpSettings()
 
             stats = dumper.dump_table(
-                "users", output_path, settings, OutputFormat.SQL
+                mock_connection, "users", output_path, settings, OutputFormat.SQL
             )
 
             assert isinstance(stats, TableStats)
             assert stats.table == "users"
+
+    def test_dump_table_uses_prefetched_columns(self, mock_connection):
+        """Test prefetched columns skip the per-table metadata query."""
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchmany.return_value = []
+        mock_connection.get_cursor.return_value = mock_cursor
+
+        dumper = TableDumper({"compress": False})
+        columns = [ColumnInfo("id", "int(11)", "NO", "PRI", None, "")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.sql"
+
+            stats = dumper.dump_table(
+                mock_connection, "users", output_path, DumpSettings(), OutputFormat.SQL,
+                columns=columns
+            )
+
+        assert stats.success is True
+        mock_connection.get_table_columns.assert_not_called()
+        mock_cursor.execute.assert_called_once_with("SELECT `id` FROM `users`")
+
+
+class TestDumpOutput:
+    """Tests for the content written by dump_table."""
+
+    @pytest.fixture
+    def mock_connection(self):
+        """Create a mock connection returning two rows."""
+        conn = mock.MagicMock()
+        conn.get_table_columns.return_value = [
+            ColumnInfo("id", "int(11)", "NO", "PRI", None, ""),
+            ColumnInfo("name", "varchar(255)", "YES", "", None, ""),
+        ]
+        conn.get_create_table.return_value = "CREATE TABLE `users` (`id` int, `name` varchar(255))"
+        mock_cursor = mock.MagicMock()
+        mock_cursor.fetchmany.side_effect = [[(1, "José"), (2, "a,b")], []]
+        conn.get_cursor.return_value = mock_cursor
+        return conn
+
+    def test_sql_output(self, mock_connection):
+        """Test SQL output contains the schema and UTF-8 encoded inserts."""
+        dumper = TableDumper({})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "users.sql"
+            stats = dumper.dump_table(
+                mock_connection, "users", output_path, DumpSettings(), OutputFormat.SQL
+            )
+            content = output_path.read_text(encoding='utf-8')
+
+        assert stats.rows_dumped == 2
+        assert "DROP TABLE IF EXISTS `users`;" in content
+        assert "CREATE TABLE `users` (`id` int, `name` varchar(255));" in content
+        assert (
+            "INSERT INTO `users` (`id`, `name`) VALUES\n  (1, 'José'),\n  (2, 'a,b');"
+        ) in content
+        assert content.endswith("-- Dump complete. 2 rows.\n")
+
+    def test_sql_header_uses_dump_timestamp(self, mock_connection):
+        """Test the header carries the run's timestamp rather than the table's."""
+        dumper = TableDumper({}, dump_timestamp="2024-12-29T14:30:22")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "users.sql"
+            dumper.dump_table(mock_connection, "users", output_path, DumpSettings())
+            content = output_path.read_text(encoding='utf-8')
+
+        assert content.startswith(
+            "-- MySQL Dump\n-- Table: users\n-- Generated: 2024-12-29T14:30:22\n"
+        )
+
+    def test_csv_output_compressed(self, mock_connection):
+        """Test compressed CSV output is readable and the file is closed cleanly."""
+        dumper = TableDumper({"compress": True})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "users.csv"
+            stats = dumper.dump_table(
+                mock_connection, "users", output_path, DumpSettings(), OutputFormat.CSV
+            )
+            with gzip.open(stats.file_path, 'rt', encoding='utf-8', newline='') as f:
+                content = f.read()
+
+        assert stats.success is True
+        assert content == 'id,name\r\n1,José\r\n2,"a,b"\r\n'
+
+    def test_sql_batches_follow_fetches(self, mock_connection):
+        """Test each fetched chunk is written as its own INSERT statement."""
+        mock_connection.get_cursor.return_value.fetchmany.side_effect = [
+            [(1, "a"), (2, "b")], [(3, "c")], []
+        ]
+        dumper = TableDumper({"batch_size": 2})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "users.sql"
+            stats = dumper.dump_table(
+                mock_connection, "users", output_path, DumpSettings(), OutputFormat.SQL
+            )
+            content = output_path.read_text(encoding='utf-8')
+
+        assert stats.rows_dumped == 3
+        assert content.count("INSERT INTO") == 2
+        mock_connection.get_cursor.assert_called_once_with(fetch_size=2)
+        mock_connection.get_cursor.return_value.fetchmany.assert_called_with(2)
+
+
+class TestPrefetch:
+    """Tests for reading batches ahead in a background thread."""
+
+    def test_disabled_by_default(self):
+        """Test batches are fetched in the writing thread unless configured."""
+        assert TableDumper({}).prefetch_batches == 0
+
+    def test_yields_batches_in_order(self):
+        """Test every batch arrives once and in fetch order."""
+        dumper = TableDumper({"prefetch_batches": 2})
+        batches = ([(i,)] for i in range(10))
+
+        assert list(dumper._prefetch(batches)) == [[(i,)] for i in range(10)]
+
+    def test_fetch_error_reaches_consumer(self):
+        """Test an error raised while fetching is re-raised to the writer."""
+        dumper = TableDumper({"prefetch_batches": 1})
+
+        def batches():
+            yield [(1,)]
+            raise RuntimeError("lost connection")
+
+        result = dumper._prefetch(batches())
+        assert next(result) == [(1,)]
+        with pytest.raises(RuntimeError, match="lost connection"):
+            next(result)
+
+    def test_early_stop_closes_source(self):
+        """Test abandoning the stream stops the reader and closes the source."""
+        dumper = TableDumper({"prefetch_batches": 1})
+        closed = []
+
+        def batches():
+            try:
+                while True:
+                    yield [(1,)]
+            finally:
+                closed.append(True)
+
+        result = dumper._prefetch(batches())
+        next(result)
+        result.close()
+
+        assert closed == [True]
+
+    def test_dump_with_prefetch(self):
+        """Test a full SQL dump through the reader thread."""
+        conn = mock.MagicMock()
+        conn.get_create_table.return_value = "CREATE TABLE `t` (`id` int)"
+        conn.get_cursor.return_value.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+        dumper = TableDumper({"prefetch_batches": 2, "batch_size": 2})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "t.sql"
+            stats = dumper.dump_table(
+                conn, "t", output_path, DumpSettings(),
+                columns=[ColumnInfo("id", "int", "NO", "PRI", None, "")]
+            )
+            content = output_path.read_text(encoding='utf-8')
+
+        assert stats.rows_dumped == 3
+        assert "VALUES\n  (1),\n  (2);" in content
+        assert "VALUES\n  (3);" in content
+        conn.close_cursor.assert_called_once()
+
+
+class TestKeysetPagination:
+    """Tests for keyset-paginated table reads."""
+
+    @pytest.fixture
+    def columns(self):
+        """Columns of a table with an integer primary key."""
+        return [
+            ColumnInfo("id", "int(11)", "NO", "PRI", None, "auto_increment"),
+            ColumnInfo("name", "varchar(255)", "YES", "", None, ""),
+        ]
+
+    @pytest.fixture
+    def dumper(self):
+        """Create a TableDumper with keyset pagination enabled."""
+        return TableDumper({"keyset_page_size": 2})
+
+    def test_disabled_by_default(self):
+        """Test keyset pagination is off unless configured."""
+        assert TableDumper({}).keyset_page_size == 0
+
+    def test_find_keyset_column(self, dumper, columns):
+        """Test a single numeric primary key is used."""
+        assert dumper._find_keyset_column(columns, DumpSettings()) == "id"
+
+    def test_no_keyset_for_composite_key(self, dumper):
+        """Test composite primary keys fall back to a single SELECT."""
+        columns = [
+            ColumnInfo("a", "int", "NO", "PRI", None, ""),
+            ColumnInfo("b", "int", "NO", "PRI", None, ""),
+        ]
+        assert dumper._find_keyset_column(columns, DumpSettings()) is None
+
+    def test_no_keyset_for_string_key(self, dumper):
+        """Test string primary keys fall back to a single SELECT."""
+        columns = [ColumnInfo("code", "varchar(10)", "NO", "PRI", None, "")]
+        assert dumper._find_keyset_column(columns, DumpSettings()) is None
+
+    def test_no_keyset_with_other_ordering(self, dumper, columns):
+        """Test a custom order_by disables keyset pagination."""
+        assert dumper._find_keyset_column(columns, DumpSettings(order_by="name")) is None
+        assert dumper._find_keyset_column(
+            columns, DumpSettings(order_by="id", order_direction="DESC")
+        ) is None
+        assert dumper._find_keyset_column(columns, DumpSettings(order_by="id")) == "id"
+
+    def test_pages_follow_last_key(self, dumper):
+        """Test each page starts after the last key of the previous one."""
+        connection = mock.MagicMock()
+        cursor = connection.get_cursor.return_value
+        cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], [], [(5, "c")], []]
+
+        batches = list(dumper._fetch_keyset_batches(
+            connection, "users", ["id", "name"],
+            DumpSettings(where_clause="name <> ''"), "id", 1000
+        ))
+
+        assert batches == [[(1, "a"), (2, "b")], [(5, "c")]]
+        queries = [c.args[0] for c in cursor.execute.call_args_list]
+        assert queries == [
+            "SELECT `id`, `name` FROM `users` WHERE (name <> '') ORDER BY `id` ASC LIMIT 2",
+            "SELECT `id`, `name` FROM `users` WHERE (name <> '') AND `id` > 2 "
+            "ORDER BY `id` ASC LIMIT 2",
+        ]
+
+    def test_row_limit_across_pages(self, dumper):
+        """Test row_limit caps the total rows over all pages."""
+        connection = mock.MagicMock()
+        cursor = connection.get_cursor.return_value
+        cursor.fetchmany.side_effect = [[(1,), (2,)], [], [(3,)], []]
+
+        batches = list(dumper._fetch_keyset_batches(
+            connection, "t", ["id"], DumpSettings(row_limit=3), "id", 1000
+        ))
+
+        assert sum(len(b) for b in batches) == 3
+        assert cursor.execute.call_args_list[-1].args[0].endswith("LIMIT 1")
+
+    def test_keyset_literal_keeps_precision(self, dumper):
+        """Test temporal keys keep fractional seconds in the WHERE condition."""
+        value = datetime(2024, 1, 1, 12, 0, 0, 500)
+        assert dumper._keyset_literal(value) == "'2024-01-01 12:00:00.000500'"
+
+    def test_keyset_literal_decimal_unquoted(self, dumper):
+        """Test decimal keys stay exact numeric literals instead of quoted strings."""
+        assert dumper._keyset_literal(Decimal("9007199254740993")) == "9007199254740993"
+        assert dumper._keyset_literal(Decimal("1.50")) == "1.50"
+
+    def test_dump_table_uses_keyset(self, dumper, columns):
+        """Test dump_table reads through keyset pages when enabled."""
+        connection = mock.MagicMock()
+        connection.get_create_table.return_value = "CREATE TABLE `users` (...)"
+        connection.get_cursor.return_value.fetchmany.side_effect = [[(1, "a")], []]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats = dumper.dump_table(
+                connection, "users", Path(tmpdir) / "users.sql", DumpSettings(),
+                OutputFormat.SQL, columns=columns
+            )
+
+        assert stats.rows_dumped == 1
+        query = connection.get_cursor.return_value.execute.call_args.args[0]
+        assert query.endswith("ORDER BY `id` ASC LIMIT 2")
+
+
+class TestMysqldump:
+    """Tests for the optional mysqldump path."""
+
+    @pytest.fixture
+    def dumper(self):
+        """Create a TableDumper that finds a mysqldump binary."""
+        with mock.patch('src.table_dumper.shutil.which', return_value="/usr/bin/mysqldump"):
+            return TableDumper({"use_mysqldump": True}, dump_timestamp="2024-12-29T14:30:22")
+
+    @pytest.fixture
+    def connection(self):
+        """Create a mock connection with credentials."""
+        conn = mock.MagicMock()
+        conn.host, conn.port, conn.user = "localhost", 3306, "root"
+        conn.password, conn.database = 's3cr"et', "shop"
+        conn.compress, conn.net_write_timeout = False, None
+        return conn
+
+    def test_disabled_by_default(self):
+        """Test mysqldump is only used when enabled."""
+        assert TableDumper({}).mysqldump_path is None
+
+    def test_missing_binary_falls_back(self):
+        """Test a missing mysqldump leaves the built-in dumper in use."""
+        with mock.patch('src.table_dumper.shutil.which', return_value=None):
+            dumper = TableDumper({"use_mysqldump": True})
+        assert not dumper._can_use_mysqldump(OutputFormat.SQL, DumpSettings())
+
+    def test_eligibility(self, dumper):
+        """Test CSV, row limits and ordering keep the built-in path."""
+        assert dumper._can_use_mysqldump(OutputFormat.SQL, DumpSettings(where_clause="id > 1"))
+        assert not dumper._can_use_mysqldump(OutputFormat.CSV, DumpSettings())
+        assert not dumper._can_use_mysqldump(OutputFormat.SQL, DumpSettings(row_limit=10))
+        assert not dumper._can_use_mysqldump(OutputFormat.SQL, DumpSettings(order_by="id"))
+
+    @mock.patch('src.table_dumper.subprocess.Popen')
+    def test_streams_output(self, mock_popen, dumper, connection):
+        """Test mysqldump output is copied into the dump file and rows are counted."""
+        output = (
+            b"DROP TABLE IF EXISTS `orders`;\nCREATE TABLE `orders` (`id` int);\n"
+            b"INSERT INTO `orders` VALUES (1),(2),(3);\nINSERT INTO `orders` VALUES (4);\n"
+        )
+        process = mock_popen.return_value
+        process.stdout = io.BytesIO(output)
+        process.wait.return_value = 0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "orders.sql"
+            stats = dumper.dump_table(
+                connection, "orders", output_path, DumpSettings(where_clause="id > 0")
+            )
+            content = output_path.read_bytes()
+
+        assert stats.success is True
+        assert stats.rows_dumped == 4
+        assert stats.rows_approximate is True
+        assert content.startswith(b"-- MySQL Dump (mysqldump)\n-- Table: orders\n")
+        assert output in content
+        assert content.endswith(b"-- Dump complete. About 4 rows.\n")
+
+        command = mock_popen.call_args.args[0]
+        assert command[0] == "/usr/bin/mysqldump"
+        assert command[1].startswith("--defaults-extra-file=")
+        assert "--where=id > 0" in command
+        assert command[-2:] == ["shop", "orders"]
+        assert not any("s3cr" in arg for arg in command)
+        connection.get_cursor.assert_not_called()
+
+    @mock.patch('src.table_dumper.subprocess.Popen')
+    def test_empty_password(self, mock_popen, dumper, connection):
+        """Test a passwordless user (password: null) can use mysqldump."""
+        connection.password = None
+        process = mock_popen.return_value
+        process.stdout = io.BytesIO(b"")
+        process.wait.return_value = 0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats = dumper.dump_table(
+                connection, "orders", Path(tmpdir) / "orders.sql", DumpSettings()
+            )
+
+        assert stats.success is True
+
+    @mock.patch('src.table_dumper.subprocess.run')
+    def test_session_options(self, mock_run, dumper, connection):
+        """Test compress and net_write_timeout are passed on to mysqldump."""
+        connection.compress, connection.net_write_timeout = True, 600
+        mock_run.return_value.stdout = b"  --init-command=name  SQL Command to execute\n"
+
+        assert dumper._mysqldump_session_options(connection) == [
+            "--compress", "--init-command=SET SESSION net_write_timeout = 600"
+        ]
+        assert dumper._mysqldump_session_options(connection)
+        mock_run.assert_called_once()
+
+    @mock.patch('src.table_dumper.subprocess.run')
+    def test_session_options_without_init_command(self, mock_run, dumper, connection):
+        """Test older mysqldump releases keep their own network timeouts."""
+        connection.net_write_timeout = 600
+        mock_run.return_value.stdout = b"  --compress  Use compression\n"
+
+        assert dumper._mysqldump_session_options(connection) == []
+
+    @mock.patch('src.table_dumper.subprocess.Popen')
+    def test_failure_reported(self, mock_popen, dumper, connection):
+        """Test a non-zero exit status marks the table as failed."""
+        process = mock_popen.return_value
+        process.stdout = io.BytesIO(b"")
+        process.wait.return_value = 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats = dumper.dump_table(
+                connection, "orders", Path(tmpdir) / "orders.sql", DumpSettings()
+            )
+
+        assert stats.success is False
+        assert "mysqldump exited with status 2" in stats.error
+
+    def test_row_count_across_chunks(self, dumper):
+        """Test separators split across read chunks are still counted."""
+        dumper.MYSQLDUMP_COPY_BUFFER = 5
+        source = io.BytesIO(b"INSERT INTO `t` VALUES (1),(2),(3);\n")
+        target = io.BytesIO()
+
+        assert dumper._copy_mysqldump_output(source, target) == 3
+        assert target.getvalue() == source.getvalue()
@@ -115,11 +115,6 @@ def test_zero_row_limit(self):
 class TestPrintDryRunInfo:
     """Tests for print_dry_run_info function."""
 
-    @pytest.fixture(autouse=True)
-    def setup_logging(self):
-        """Setup logging for tests."""
-        logging.basicConfig(level=logging.INFO)
-
     def test_all_tables(self, caplog):
         """Test dry run info for all tables."""
         databases = [